@@ -26,6 +26,18 @@ class IssueWithMetrics:
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = (
+        "title",
+        "html_url",
+        "author",
+        "time_to_first_response",
+        "time_to_close",
+        "time_to_answer",
+        "time_in_draft",
+        "label_metrics",
+        "mentor_activity",
+    )
+
     def __init__(
         self,
         title,
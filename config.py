@@ -54,6 +54,7 @@ class EnvVars:
         rate_limit_bypass (bool): If set to TRUE, bypass the rate limit for the GitHub API
         draft_pr_tracking (bool): If set to TRUE, track PR time in draft state
             in addition to other metrics
+        max_workers (int): The number of issues/prs/discussions to measure concurrently
     """
 
     def __init__(
@@ -82,6 +83,7 @@ class EnvVars:
         output_file: str,
         rate_limit_bypass: bool = False,
         draft_pr_tracking: bool = False,
+        max_workers: int = 1,
     ):
         self.gh_app_id = gh_app_id
         self.gh_app_installation_id = gh_app_installation_id
@@ -107,6 +109,7 @@ class EnvVars:
         self.output_file = output_file
         self.rate_limit_bypass = rate_limit_bypass
         self.draft_pr_tracking = draft_pr_tracking
+        self.max_workers = max_workers
 
     def __repr__(self):
         return (
@@ -135,6 +138,7 @@ class EnvVars:
             f"{self.output_file}"
             f"{self.rate_limit_bypass}"
             f"{self.draft_pr_tracking}"
+            f"{self.max_workers}"
         )
 
 
@@ -221,6 +225,11 @@ def get_env_vars(test: bool = False) -> EnvVars:
     output_file = os.getenv("OUTPUT_FILE", "")
     rate_limit_bypass = get_bool_env_var("RATE_LIMIT_BYPASS", False)
     draft_pr_tracking = get_bool_env_var("DRAFT_PR_TRACKING", False)
+    max_workers = get_int_env_var("MAX_WORKERS")
+    if max_workers is None:
+        max_workers = 1
+    elif max_workers < 1:
+        raise ValueError("MAX_WORKERS environment variable must be a positive integer")
 
     # Hidden columns
     hide_author = get_bool_env_var("HIDE_AUTHOR", False)
@@ -260,4 +269,5 @@ def get_env_vars(test: bool = False) -> EnvVars:
         output_file,
         rate_limit_bypass,
         draft_pr_tracking,
+        max_workers,
     )
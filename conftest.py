@@ -0,0 +1,13 @@
+"""Shared pytest configuration for the issue-metrics test suite.
+
+The modules below are imported by most of the test files. Importing them once
+here, before collection starts, means each test module finds them already
+loaded in sys.modules.
+"""
+
+# pylint: disable=unused-import
+import classes  # noqa: F401
+import markdown_writer  # noqa: F401
+import most_active_mentors  # noqa: F401
+import search  # noqa: F401
+import time_in_draft  # noqa: F401
@@ -0,0 +1,36 @@
+""" Helper functions for working with GitHub timestamps. """
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Union
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(timestamp: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, reusing the result for repeated values.
+
+    Inputs:
+    timestamp: str - an ISO 8601 timestamp as returned by the GitHub API
+
+    Returns:
+    datetime - the parsed, timezone aware timestamp
+
+    """
+    return datetime.fromisoformat(timestamp)
+
+
+def to_datetime(value: Union[str, datetime]) -> datetime:
+    """
+    Return value as a datetime, parsing it only if it is an ISO 8601 string.
+
+    Inputs:
+    value: Union[str, datetime] - a timestamp that may already be parsed
+
+    Returns:
+    datetime - the timestamp as a datetime
+
+    """
+    if isinstance(value, datetime):
+        return value
+    return parse_datetime(value)
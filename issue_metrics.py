@@ -6,6 +6,9 @@ the average time to first response and time to close and writes the issues with
 their metrics to a markdown file.
 
 Functions:
+    measure_issue(issue: Union[dict, github3.search.IssueSearchResult],
+        env_vars: EnvVars, ...) -> Union[tuple[IssueWithMetrics, str], None]:
+        Calculate the metrics for a single issue, pull request or discussion.
     get_per_issue_metrics(issues: Union[List[dict], List[github3.issues.Issue]],
         discussions: bool = False), labels: Union[List[str], None] = None,
         ignore_users: List[str] = [] -> tuple[List, int, int]:
@@ -16,6 +19,9 @@ Functions:
 """
 
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 from typing import List, Union
 
 import github3
@@ -41,6 +47,156 @@ from time_to_merge import measure_time_to_merge
 from time_to_ready_for_review import get_time_to_ready_for_review
 
 
+def measure_issue(
+    issue: Union[dict, github3.search.IssueSearchResult],  # type: ignore
+    env_vars: EnvVars,
+    discussions: bool = False,
+    labels: Union[List[str], None] = None,
+    ignore_users: Union[List[str], None] = None,
+    max_comments_to_eval: int = 20,
+    heavily_involved: int = 3,
+    now: Union[datetime, None] = None,
+) -> Union[tuple[IssueWithMetrics, str], None]:
+    """
+    Calculate the metrics for a single issue/pr/discussion.
+
+    Args:
+        issue (Union[dict, github3.search.IssueSearchResult]): A GitHub issue or discussion.
+        env_vars (EnvVars): The environment variables for the script.
+        discussions (bool, optional): Whether the issue is a discussion or not.
+            Defaults to False.
+        labels (List[str]): A list of labels to measure time spent in. Defaults to empty list.
+        ignore_users (List[str]): A list of users to ignore when calculating metrics.
+        now (Union[datetime, None]): The time an ongoing draft is measured up to.
+            Defaults to the current time.
+
+    Returns:
+        Union[tuple[IssueWithMetrics, str], None]: The issue with its metrics and
+            whether it is "open" or "closed", or None if its author is ignored.
+
+    """
+    if discussions:
+        issue_with_metrics = IssueWithMetrics(
+            issue["title"],
+            issue["url"],
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+        )
+        if env_vars.hide_time_to_first_response is False:
+            issue_with_metrics.time_to_first_response = measure_time_to_first_response(
+                None, issue, ignore_users
+            )
+        if env_vars.enable_mentor_count:
+            issue_with_metrics.mentor_activity = count_comments_per_user(
+                None,
+                issue,
+                None,
+                None,
+                ignore_users,
+                max_comments_to_eval,
+                heavily_involved,
+            )
+        if env_vars.hide_time_to_answer is False:
+            issue_with_metrics.time_to_answer = measure_time_to_answer(issue)
+        if not issue["closedAt"]:
+            return issue_with_metrics, "open"
+        if not env_vars.hide_time_to_close:
+            issue_with_metrics.time_to_close = measure_time_to_close(None, issue)
+        return issue_with_metrics, "closed"
+
+    if ignore_users and issue.user["login"] in ignore_users:  # type: ignore
+        return None
+
+    issue_with_metrics = IssueWithMetrics(
+        title=issue.title,  # type: ignore
+        html_url=issue.html_url,  # type: ignore
+        author=issue.user["login"],  # type: ignore
+    )
+
+    # Check if issue is actually a pull request
+    pull_request, ready_for_review_at = None, None
+    if issue.issue.pull_request_urls:  # type: ignore
+        pull_request = issue.issue.pull_request()  # type: ignore
+        # When draft time is tracked, fetch the events once and share
+        # them with the ready for review lookup
+        if env_vars.draft_pr_tracking:
+            try:
+                events = list(issue.issue.events())  # type: ignore
+            except TypeError as e:
+                print(
+                    f"An error occurred processing review events. Perhaps issue contains a ghost user. {e}"
+                )
+            else:
+                ready_for_review_at = get_time_to_ready_for_review(
+                    issue, pull_request, events
+                )
+                issue_with_metrics.time_in_draft = measure_time_in_draft(
+                    issue=issue, pull_request=pull_request, now=now, events=events
+                )
+        else:
+            ready_for_review_at = get_time_to_ready_for_review(issue, pull_request)
+
+    # Time to first response and the mentor count read the same comments
+    # and reviews, so fetch them once when both are measured
+    comments, reviews = None, None
+    if env_vars.hide_time_to_first_response is False and env_vars.enable_mentor_count:
+        comments = []
+        if issue.issue.comments_count:  # type: ignore
+            comments = list(
+                issue.issue.comments(  # type: ignore
+                    number=max(20, max_comments_to_eval),
+                    sort="created",
+                    direction="asc",
+                )
+            )
+        if pull_request:
+            try:
+                reviews = list(
+                    pull_request.reviews(number=max(50, max_comments_to_eval))
+                )
+            except TypeError:
+                # A ghost reviewer; let each measurement fetch and guard its
+                # own reviews as it did before
+                reviews = None
+
+    if env_vars.hide_time_to_first_response is False:
+        issue_with_metrics.time_to_first_response = measure_time_to_first_response(
+            issue,
+            None,
+            pull_request,
+            ready_for_review_at,
+            ignore_users,
+            comments,
+            reviews,
+        )
+    if env_vars.enable_mentor_count:
+        issue_with_metrics.mentor_activity = count_comments_per_user(
+            issue,
+            None,
+            pull_request,
+            ready_for_review_at,
+            ignore_users,
+            max_comments_to_eval,
+            heavily_involved,
+            comments,
+            reviews,
+        )
+    if labels and env_vars.hide_label_metrics is False:
+        issue_with_metrics.label_metrics = get_label_metrics(issue, labels)
+    if issue.state == "closed" and not env_vars.hide_time_to_close:  # type: ignore
+        if pull_request:
+            issue_with_metrics.time_to_close = measure_time_to_merge(
+                pull_request, ready_for_review_at
+            )
+        else:
+            issue_with_metrics.time_to_close = measure_time_to_close(issue, None)
+    return issue_with_metrics, issue.state  # type: ignore
+
+
 def get_per_issue_metrics(
     issues: Union[List[dict], List[github3.search.IssueSearchResult]],  # type: ignore
     env_vars: EnvVars,
@@ -49,6 +205,7 @@ def get_per_issue_metrics(
     ignore_users: Union[List[str], None] = None,
     max_comments_to_eval: int = 20,
     heavily_involved: int = 3,
+    max_workers: int = 1,
 ) -> tuple[List, int, int]:
     """
     Calculate the metrics for each issue/pr/discussion in a list provided.
@@ -61,6 +218,7 @@ def get_per_issue_metrics(
         labels (List[str]): A list of labels to measure time spent in. Defaults to empty list.
         ignore_users (List[str]): A list of users to ignore when calculating metrics.
         env_vars (EnvVars): The environment variables for the script.
+        max_workers (int): How many issues to measure concurrently. Defaults to 1.
 
     Returns:
         tuple[List[IssueWithMetrics], int, int]: A tuple containing a
@@ -71,95 +229,31 @@ def get_per_issue_metrics(
     issues_with_metrics = []
     num_issues_open = 0
     num_issues_closed = 0
+    # Measure every ongoing draft up to the same moment
+    now = datetime.now(timezone.utc)
 
-    for issue in issues:
-        if discussions:
-            issue_with_metrics = IssueWithMetrics(
-                issue["title"],
-                issue["url"],
-                None,
-                None,
-                None,
-                None,
-                None,
-                None,
-            )
-            if env_vars.hide_time_to_first_response is False:
-                issue_with_metrics.time_to_first_response = (
-                    measure_time_to_first_response(None, issue, ignore_users)
-                )
-            if env_vars.enable_mentor_count:
-                issue_with_metrics.mentor_activity = count_comments_per_user(
-                    None,
-                    issue,
-                    None,
-                    None,
-                    ignore_users,
-                    max_comments_to_eval,
-                    heavily_involved,
-                )
-            if env_vars.hide_time_to_answer is False:
-                issue_with_metrics.time_to_answer = measure_time_to_answer(issue)
-            if issue["closedAt"]:
-                num_issues_closed += 1
-                if not env_vars.hide_time_to_close:
-                    issue_with_metrics.time_to_close = measure_time_to_close(
-                        None, issue
-                    )
-            else:
-                num_issues_open += 1
-        else:
-            if ignore_users and issue.user["login"] in ignore_users:  # type: ignore
+    measure = partial(
+        measure_issue,
+        env_vars=env_vars,
+        discussions=discussions,
+        labels=labels,
+        ignore_users=ignore_users,
+        max_comments_to_eval=max_comments_to_eval,
+        heavily_involved=heavily_involved,
+        now=now,
+    )
+    # Each item only needs its own API calls, so several can be measured at
+    # once; map() still yields the results in the original order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(measure, issues):
+            if result is None:
                 continue
-
-            issue_with_metrics = IssueWithMetrics(
-                title=issue.title,  # type: ignore
-                html_url=issue.html_url,  # type: ignore
-                author=issue.user["login"],  # type: ignore
-            )
-
-            # Check if issue is actually a pull request
-            pull_request, ready_for_review_at = None, None
-            if issue.issue.pull_request_urls:  # type: ignore
-                pull_request = issue.issue.pull_request()  # type: ignore
-                ready_for_review_at = get_time_to_ready_for_review(issue, pull_request)
-                if env_vars.draft_pr_tracking:
-                    issue_with_metrics.time_in_draft = measure_time_in_draft(
-                        issue=issue
-                    )
-
-            if env_vars.hide_time_to_first_response is False:
-                issue_with_metrics.time_to_first_response = (
-                    measure_time_to_first_response(
-                        issue, None, pull_request, ready_for_review_at, ignore_users
-                    )
-                )
-            if env_vars.enable_mentor_count:
-                issue_with_metrics.mentor_activity = count_comments_per_user(
-                    issue,
-                    None,
-                    pull_request,
-                    ready_for_review_at,
-                    ignore_users,
-                    max_comments_to_eval,
-                    heavily_involved,
-                )
-            if labels and env_vars.hide_label_metrics is False:
-                issue_with_metrics.label_metrics = get_label_metrics(issue, labels)
-            if issue.state == "closed":  # type: ignore
+            issue_with_metrics, state = result
+            if state == "closed":
                 num_issues_closed += 1
-                if not env_vars.hide_time_to_close:
-                    if pull_request:
-                        issue_with_metrics.time_to_close = measure_time_to_merge(
-                            pull_request, ready_for_review_at
-                        )
-                    else:
-                        issue_with_metrics.time_to_close = measure_time_to_close(
-                            issue, None
-                        )
-            elif issue.state == "open":  # type: ignore
+            elif state == "open":
                 num_issues_open += 1
-        issues_with_metrics.append(issue_with_metrics)
+            issues_with_metrics.append(issue_with_metrics)
 
     return issues_with_metrics, num_issues_open, num_issues_closed
 
@@ -296,6 +390,7 @@ def main():  # pragma: no cover
         max_comments_to_eval=max_comments_eval,
         heavily_involved=heavily_involved_cutoff,
         env_vars=env_vars,
+        max_workers=env_vars.max_workers,
     )
 
     stats_time_to_first_response = get_stats_time_to_first_response(issues_with_metrics)
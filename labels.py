@@ -1,12 +1,12 @@
 """ Functions for calculating time spent in labels. """
 
-from datetime import datetime, timedelta
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import List, cast
 
 import github3
-import numpy
-import pytz
 from classes import IssueWithMetrics
+from datetime_helpers import parse_datetime
+from stats import get_duration_stats
 
 
 def get_label_events(
@@ -58,7 +58,7 @@ def get_label_metrics(issue: github3.issues.Issue, labels: List[str]) -> dict:
     for event in label_events:
         # Skip labeling events that have occured past issue close time
         if issue.closed_at is not None and (
-            event.created_at >= datetime.fromisoformat(issue.closed_at)
+            event.created_at >= parse_datetime(issue.closed_at)
         ):
             continue
 
@@ -67,34 +67,34 @@ def get_label_metrics(issue: github3.issues.Issue, labels: List[str]) -> dict:
             if event.label["name"] in labels:
                 if label_metrics[event.label["name"]] is None:
                     label_metrics[event.label["name"]] = timedelta(0)
-                label_metrics[
-                    event.label["name"]
-                ] -= event.created_at - datetime.fromisoformat(issue.created_at)
+                label_metrics[event.label["name"]] -= event.created_at - parse_datetime(
+                    issue.created_at
+                )
                 label_last_event_type[event.label["name"]] = "labeled"
         elif event.event == "unlabeled":
             unlabeled[event.label["name"]] = True
             if event.label["name"] in labels:
                 if label_metrics[event.label["name"]] is None:
                     label_metrics[event.label["name"]] = timedelta(0)
-                label_metrics[
-                    event.label["name"]
-                ] += event.created_at - datetime.fromisoformat(issue.created_at)
+                label_metrics[event.label["name"]] += event.created_at - parse_datetime(
+                    issue.created_at
+                )
                 label_last_event_type[event.label["name"]] = "unlabeled"
 
     for label in labels:
         if label in labeled:
             # if the issue is closed, add the time from the issue creation to the closed_at time
             if issue.state == "closed":
-                label_metrics[label] += datetime.fromisoformat(
+                label_metrics[label] += parse_datetime(
                     issue.closed_at
-                ) - datetime.fromisoformat(issue.created_at)
+                ) - parse_datetime(issue.created_at)
             else:
                 # skip label if last labeling event is 'unlabled' and issue is still open
                 if label_last_event_type[label] == "unlabeled":
                     continue
 
                 # if the issue is open, add the time from the issue creation to now
-                label_metrics[label] += datetime.now(pytz.utc) - datetime.fromisoformat(
+                label_metrics[label] += datetime.now(timezone.utc) - parse_datetime(
                     issue.created_at
                 )
 
@@ -123,15 +123,11 @@ def get_stats_time_in_labels(
     med_time_in_labels: dict[str, timedelta | None] = {}
     ninety_percentile_in_labels: dict[str, timedelta | None] = {}
     for label, time_list in time_in_labels.items():
-        average_time_in_labels[label] = timedelta(
-            seconds=numpy.round(numpy.average(time_list))
-        )
-        med_time_in_labels[label] = timedelta(
-            seconds=numpy.round(numpy.median(time_list))
-        )
-        ninety_percentile_in_labels[label] = timedelta(
-            seconds=numpy.round(numpy.percentile(time_list, 90, axis=0))
-        )
+        # Each list starts with its first duration, so it always has stats
+        label_stats = cast(dict[str, timedelta], get_duration_stats(time_list))
+        average_time_in_labels[label] = label_stats["avg"]
+        med_time_in_labels[label] = label_stats["med"]
+        ninety_percentile_in_labels[label] = label_stats["90p"]
 
     for label in labels:
         if label not in average_time_in_labels:
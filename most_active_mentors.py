@@ -36,7 +36,8 @@ Functions:
 
 from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Union
+from itertools import islice
+from typing import Collection, Dict, Iterable, List, Union
 
 import github3
 from classes import IssueWithMetrics
@@ -47,9 +48,11 @@ def count_comments_per_user(
     discussion: Union[dict, None] = None,
     pull_request: Union[github3.pulls.PullRequest, None] = None,
     ready_for_review_at: Union[datetime, None] = None,
-    ignore_users: List[str] | None = None,
+    ignore_users: Collection[str] | None = None,
     max_comments_to_eval=20,
     heavily_involved=3,
+    comments: Union[Iterable[github3.issues.comment.IssueComment], None] = None,
+    reviews: Union[Iterable[github3.pulls.PullReview], None] = None,
 ) -> dict:
     """Count the number of times a user was seen commenting on a single item.
 
@@ -57,25 +60,29 @@ def count_comments_per_user(
         issue (Union[github3.issues.Issue, None]): A GitHub issue.
         pull_request (Union[github3.pulls.PullRequest, None]): A GitHub pull
         request.
-        ignore_users (List[str]): A list of GitHub usernames to ignore.
+        ignore_users (Collection[str]): GitHub usernames to ignore.
         max_comments_to_eval: Maximum number of comments per item to look at.
         heavily_involved: Maximum number of comments to count for one
         user per issue.
+        comments: The issue's comments, oldest first, if the caller has
+        already fetched them.
+        reviews: The pull request's reviews if the caller has already
+        fetched them.
 
     Returns:
         dict: A dictionary of usernames seen and number of comments they left.
 
     """
-    if ignore_users is None:
-        ignore_users = []
+    ignore_users = frozenset(ignore_users or ())
     mentor_count: Dict[str, int] = {}
 
     # Get the first comments
     if issue:
-        comments = issue.issue.comments(
-            number=max_comments_to_eval, sort="created", direction="asc"
-        )  # type: ignore
-        for comment in comments:
+        if comments is None:
+            comments = issue.issue.comments(
+                number=max_comments_to_eval, sort="created", direction="asc"
+            )  # type: ignore
+        for comment in islice(comments, max_comments_to_eval):
             if ignore_comment(
                 issue.issue.user,
                 comment.user,
@@ -94,9 +101,10 @@ def count_comments_per_user(
         # Check if the issue is actually a pull request
         # so we may also get the first review comment time
         if pull_request:
-            review_comments = pull_request.reviews(number=max_comments_to_eval)
-            # type: ignore
-            for review_comment in review_comments:
+            if reviews is None:
+                reviews = pull_request.reviews(number=max_comments_to_eval)
+                # type: ignore
+            for review_comment in islice(reviews, max_comments_to_eval):
                 if ignore_comment(
                     issue.issue.user,
                     review_comment.user,
@@ -135,7 +143,7 @@ def count_comments_per_user(
 def ignore_comment(
     issue_user: github3.users.User,
     comment_user: github3.users.User,
-    ignore_users: List[str],
+    ignore_users: Collection[str],
     comment_created_at: datetime,
     ready_for_review_at: Union[datetime, None],
 ) -> bool:
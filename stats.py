@@ -0,0 +1,48 @@
+"""A module for summarizing a collection of durations.
+
+This module provides the average, median and 90th percentile calculation shared
+by the time to first response, close, answer, in draft and in label metrics.
+
+Functions:
+    get_duration_stats(
+        durations: Iterable[float]
+    ) -> Union[dict[str, timedelta], None]:
+        Calculate the average, median and 90th percentile of durations in seconds.
+
+"""
+
+from datetime import timedelta
+from statistics import fmean, median, quantiles
+from typing import Iterable, Union
+
+
+def get_duration_stats(
+    durations: Iterable[float],
+) -> Union[dict[str, timedelta], None]:
+    """Calculate the average, median and 90th percentile of a set of durations.
+
+    Args:
+        durations (Iterable[float]): Durations in seconds.
+
+    Returns:
+        Union[Dict{string: datetime.timedelta}, None]: The stats rounded to the
+            nearest second, or None if there are no durations.
+
+    """
+    seconds = list(durations)
+    if not seconds:
+        return None
+
+    # The inclusive method uses the same linear interpolation between the
+    # closest ranks as numpy.percentile, though float error can round a value
+    # that lands on half a second the other way; it needs two data points
+    if len(seconds) > 1:
+        ninety_percentile = quantiles(seconds, n=10, method="inclusive")[8]
+    else:
+        ninety_percentile = seconds[0]
+
+    return {
+        "avg": timedelta(seconds=round(fmean(seconds))),
+        "med": timedelta(seconds=round(median(seconds))),
+        "90p": timedelta(seconds=round(ninety_percentile)),
+    }
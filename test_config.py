@@ -252,6 +252,7 @@ class TestGetEnvVars(unittest.TestCase):
             "SEARCH_QUERY": SEARCH_QUERY,
             "RATE_LIMIT_BYPASS": "true",
             "DRAFT_PR_TRACKING": "True",
+            "MAX_WORKERS": "4",
         },
     )
     def test_get_env_vars_optional_values(self):
@@ -281,6 +282,7 @@ class TestGetEnvVars(unittest.TestCase):
             output_file="issue_metrics.md",
             rate_limit_bypass=True,
             draft_pr_tracking=True,
+            max_workers=4,
         )
         result = get_env_vars(True)
         self.assertEqual(str(result), str(expected_result))
@@ -349,6 +351,25 @@ class TestGetEnvVars(unittest.TestCase):
             "GH_APP_ID set and GH_APP_INSTALLATION_ID or GH_APP_PRIVATE_KEY variable not set",
         )
 
+    @patch.dict(
+        os.environ,
+        {
+            "GH_TOKEN": TOKEN,
+            "SEARCH_QUERY": SEARCH_QUERY,
+            "MAX_WORKERS": "-1",
+        },
+        clear=True,
+    )
+    def test_get_env_vars_invalid_max_workers(self):
+        """Test that an error is raised when MAX_WORKERS is not a positive integer"""
+        with self.assertRaises(ValueError) as context_manager:
+            get_env_vars(True)
+        the_exception = context_manager.exception
+        self.assertEqual(
+            str(the_exception),
+            "MAX_WORKERS environment variable must be a positive integer",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,38 @@
+""" Unit tests for the datetime_helpers module. """
+
+import unittest
+from datetime import datetime, timezone
+
+from datetime_helpers import parse_datetime, to_datetime
+
+TIMESTAMP_ISO = "2023-01-01T00:00:00Z"
+TIMESTAMP = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+class TestDatetimeHelpers(unittest.TestCase):
+    """
+    Unit tests for the datetime_helpers module.
+    """
+
+    def test_parse_datetime(self):
+        """
+        Test that parse_datetime returns an aware datetime and caches repeated timestamps.
+        """
+        parse_datetime.cache_clear()
+
+        self.assertEqual(parse_datetime(TIMESTAMP_ISO), TIMESTAMP)
+        self.assertEqual(parse_datetime(TIMESTAMP_ISO), TIMESTAMP)
+
+        self.assertEqual(parse_datetime.cache_info().misses, 1)
+        self.assertEqual(parse_datetime.cache_info().hits, 1)
+
+    def test_to_datetime(self):
+        """
+        Test that to_datetime parses strings and returns datetimes unchanged.
+        """
+        self.assertEqual(to_datetime(TIMESTAMP_ISO), TIMESTAMP)
+        self.assertIs(to_datetime(TIMESTAMP), TIMESTAMP)
+
+
+if __name__ == "__main__":
+    unittest.main()
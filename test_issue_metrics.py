@@ -14,12 +14,14 @@ Classes:
 import os
 import unittest
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch
 
 from issue_metrics import (
     IssueWithMetrics,
     get_env_vars,
     get_per_issue_metrics,
+    measure_issue,
     measure_time_to_close,
     measure_time_to_first_response,
 )
@@ -87,7 +89,7 @@ class TestGetPerIssueMetrics(unittest.TestCase):
 
         mock_comment1 = MagicMock()
         mock_comment1.created_at = datetime.fromisoformat("2023-01-02T00:00:00Z")
-        mock_issue1.issue.comments.return_value = [mock_comment1]
+        mock_issue1.issue.comments.return_value = (mock_comment1,)
         mock_issue1.issue.pull_request_urls = None
 
         mock_issue2 = MagicMock(
@@ -102,7 +104,7 @@ class TestGetPerIssueMetrics(unittest.TestCase):
 
         mock_comment2 = MagicMock()
         mock_comment2.created_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
-        mock_issue2.issue.comments.return_value = [mock_comment2]
+        mock_issue2.issue.comments.return_value = (mock_comment2,)
         mock_issue2.issue.pull_request_urls = None
 
         issues = [
@@ -196,7 +198,7 @@ class TestGetPerIssueMetrics(unittest.TestCase):
 
         mock_comment1 = MagicMock()
         mock_comment1.created_at = datetime.fromisoformat("2023-01-02T00:00:00Z")
-        mock_issue1.issue.comments.return_value = [mock_comment1]
+        mock_issue1.issue.comments.return_value = (mock_comment1,)
         mock_issue1.issue.pull_request_urls = None
 
         mock_issue2 = MagicMock(
@@ -211,7 +213,7 @@ class TestGetPerIssueMetrics(unittest.TestCase):
 
         mock_comment2 = MagicMock()
         mock_comment2.created_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
-        mock_issue2.issue.comments.return_value = [mock_comment2]
+        mock_issue2.issue.comments.return_value = (mock_comment2,)
         mock_issue2.issue.pull_request_urls = None
 
         issues = [
@@ -301,7 +303,7 @@ class TestGetPerIssueMetrics(unittest.TestCase):
 
         mock_comment1 = MagicMock()
         mock_comment1.created_at = datetime.fromisoformat("2023-01-02T00:00:00Z")
-        mock_issue1.issue.comments.return_value = [mock_comment1]
+        mock_issue1.issue.comments.return_value = (mock_comment1,)
         mock_issue1.issue.pull_request_urls = None
 
         mock_issue2 = MagicMock(
@@ -316,7 +318,7 @@ class TestGetPerIssueMetrics(unittest.TestCase):
 
         mock_comment2 = MagicMock()
         mock_comment2.created_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
-        mock_issue2.issue.comments.return_value = [mock_comment2]
+        mock_issue2.issue.comments.return_value = (mock_comment2,)
         mock_issue2.issue.pull_request_urls = None
 
         issues = [
@@ -364,6 +366,321 @@ class TestGetPerIssueMetrics(unittest.TestCase):
             expected_issues_with_metrics[0].time_to_close,
         )
 
+    @patch.dict(
+        os.environ,
+        {
+            "GH_TOKEN": "test_token",
+            "SEARCH_QUERY": "is:pr is:closed repo:user/repo",
+            "DRAFT_PR_TRACKING": "true",
+        },
+    )
+    def test_get_per_issue_metrics_with_draft_pr_tracking(self):
+        """
+        Test that a pull request's events are fetched once and shared by the
+        time in draft and ready for review measurements
+        """
+
+        # A pull request opened as a draft on Jan 1, marked ready for review
+        # on Jan 3 and merged on Jan 6
+        mock_pr = MagicMock(
+            title="PR 1",
+            html_url="https://github.com/user/repo/pull/1",
+            user={"login": "alice"},
+            state="closed",
+            created_at="2023-01-01T00:00:00Z",
+        )
+        mock_pr.issue.pull_request_urls = {"url": "https://api.github.com/pr/1"}
+        mock_pr.issue.state = "closed"
+        mock_pr.issue.created_at = datetime.fromisoformat("2023-01-01T00:00:00Z")
+        mock_pr.issue.comments_count = 0
+        mock_ready_event = MagicMock(
+            event="ready_for_review",
+            created_at=datetime.fromisoformat("2023-01-03T00:00:00Z"),
+        )
+        mock_pr.issue.events.return_value = (mock_ready_event,)
+        mock_pull_request = MagicMock(
+            draft=False,
+            created_at=datetime.fromisoformat("2023-01-01T00:00:00Z"),
+            merged_at=datetime.fromisoformat("2023-01-06T00:00:00Z"),
+        )
+        mock_pull_request.reviews.return_value = ()
+        mock_pr.issue.pull_request.return_value = mock_pull_request
+
+        (
+            result_issues_with_metrics,
+            result_num_issues_open,
+            result_num_issues_closed,
+        ) = get_per_issue_metrics(
+            [mock_pr],
+            env_vars=get_env_vars(test=True),
+        )
+
+        mock_pr.issue.events.assert_called_once()
+        self.assertEqual(result_num_issues_open, 0)
+        self.assertEqual(result_num_issues_closed, 1)
+        self.assertEqual(result_issues_with_metrics[0].time_in_draft, timedelta(days=2))
+        # Time to close is measured from when the pull request was ready for review
+        self.assertEqual(result_issues_with_metrics[0].time_to_close, timedelta(days=3))
+
+    @patch.dict(
+        os.environ,
+        {
+            "GH_TOKEN": "test_token",
+            "SEARCH_QUERY": "is:pr is:closed repo:user/repo",
+            "DRAFT_PR_TRACKING": "true",
+        },
+    )
+    def test_get_per_issue_metrics_with_draft_pr_tracking_ghost_user(self):
+        """
+        Test that a pull request whose events cannot be read because of a
+        ghost user is still measured, without draft or ready for review times
+        """
+
+        def ghost_user_events(**_kwargs):
+            yield MagicMock(
+                event="converted_to_draft",
+                created_at=datetime.fromisoformat("2023-01-02T00:00:00Z"),
+            )
+            raise TypeError("'NoneType' object is not subscriptable")
+
+        mock_pr = MagicMock(
+            title="PR 1",
+            html_url="https://github.com/user/repo/pull/1",
+            user={"login": "alice"},
+            state="closed",
+            created_at="2023-01-01T00:00:00Z",
+        )
+        mock_pr.issue.pull_request_urls = {"url": "https://api.github.com/pr/1"}
+        mock_pr.issue.state = "closed"
+        mock_pr.issue.comments_count = 0
+        mock_pr.issue.events.side_effect = ghost_user_events
+        mock_pull_request = MagicMock(
+            draft=False,
+            created_at=datetime.fromisoformat("2023-01-01T00:00:00Z"),
+            merged_at=datetime.fromisoformat("2023-01-06T00:00:00Z"),
+        )
+        mock_pull_request.reviews.return_value = ()
+        mock_pr.issue.pull_request.return_value = mock_pull_request
+
+        result_issues_with_metrics, _, result_num_issues_closed = get_per_issue_metrics(
+            [mock_pr],
+            env_vars=get_env_vars(test=True),
+        )
+
+        self.assertEqual(result_num_issues_closed, 1)
+        self.assertIsNone(result_issues_with_metrics[0].time_in_draft)
+        # Without a ready for review time, time to close runs from creation
+        self.assertEqual(result_issues_with_metrics[0].time_to_close, timedelta(days=5))
+
+    @patch.dict(
+        os.environ,
+        {"GH_TOKEN": "test_token", "SEARCH_QUERY": "is:issue repo:user/repo"},
+    )
+    def test_get_per_issue_metrics_with_max_workers(self):
+        """
+        Test that measuring issues concurrently keeps the search order and
+        the open and closed counts, and still skips ignored authors
+        """
+
+        issues = []
+        for number in range(1, 9):
+            mock_issue = MagicMock(
+                title=f"Issue {number}",
+                html_url=f"https://github.com/user/repo/issues/{number}",
+                user={"login": "alice" if number % 3 == 0 else "bob"},
+                state="closed" if number % 2 else "open",
+                created_at="2023-01-01T00:00:00Z",
+                closed_at="2023-01-04T00:00:00Z",
+            )
+            mock_issue.issue.comments.return_value = ()
+            mock_issue.issue.pull_request_urls = None
+            issues.append(mock_issue)
+
+        env_vars = get_env_vars(test=True)
+        sequential = get_per_issue_metrics(
+            issues, env_vars=env_vars, ignore_users=["alice"]
+        )
+        (
+            result_issues_with_metrics,
+            result_num_issues_open,
+            result_num_issues_closed,
+        ) = get_per_issue_metrics(
+            issues, env_vars=env_vars, ignore_users=["alice"], max_workers=4
+        )
+
+        self.assertEqual(
+            [issue.title for issue in result_issues_with_metrics],
+            ["Issue 1", "Issue 2", "Issue 4", "Issue 5", "Issue 7", "Issue 8"],
+        )
+        self.assertEqual(
+            [
+                (issue.title, issue.time_to_close)
+                for issue in result_issues_with_metrics
+            ],
+            [(issue.title, issue.time_to_close) for issue in sequential[0]],
+        )
+        self.assertEqual(result_num_issues_open, sequential[1])
+        self.assertEqual(result_num_issues_closed, sequential[2])
+        self.assertEqual((result_num_issues_open, result_num_issues_closed), (3, 3))
+
+    @patch.dict(
+        os.environ,
+        {"GH_TOKEN": "test_token", "SEARCH_QUERY": "is:issue repo:user/repo"},
+    )
+    def test_measure_issue(self):
+        """
+        Test that measure_issue returns an item with its state, or None
+        when its author is ignored
+        """
+        env_vars = get_env_vars(test=True)
+        mock_issue = MagicMock(
+            title="Issue 1",
+            html_url="https://github.com/user/repo/issues/1",
+            user={"login": "alice"},
+            state="closed",
+            created_at="2023-01-01T00:00:00Z",
+            closed_at="2023-01-04T00:00:00Z",
+        )
+        mock_issue.issue.comments.return_value = ()
+        mock_issue.issue.pull_request_urls = None
+
+        self.assertIsNone(measure_issue(mock_issue, env_vars, ignore_users=["alice"]))
+
+        issue_with_metrics, state = measure_issue(mock_issue, env_vars)
+        self.assertEqual(state, "closed")
+        self.assertEqual(issue_with_metrics.author, "alice")
+        self.assertEqual(issue_with_metrics.time_to_close, timedelta(days=3))
+
+    @patch.dict(
+        os.environ,
+        {
+            "GH_TOKEN": "test_token",
+            "SEARCH_QUERY": "is:pr is:open repo:user/repo",
+            "ENABLE_MENTOR_COUNT": "true",
+        },
+    )
+    def test_get_per_issue_metrics_shares_comments_and_reviews(self):
+        """
+        Test that comments and reviews are fetched once and shared by the
+        time to first response and mentor count measurements
+        """
+        author = SimpleNamespace(login="alice", type="User")
+        reviewer = SimpleNamespace(login="bob", type="User")
+
+        def make_pull_request(number, comments):
+            mock_pr = MagicMock(
+                title=f"PR {number}",
+                html_url=f"https://github.com/user/repo/pull/{number}",
+                user={"login": "alice"},
+                state="open",
+                created_at="2023-01-01T00:00:00Z",
+            )
+            mock_pr.issue.user = author
+            mock_pr.issue.pull_request_urls = {"url": f"pr/{number}"}
+            mock_pr.issue.events.return_value = ()
+            mock_pr.issue.comments_count = len(comments)
+            mock_comments = MagicMock(return_value=comments)
+            mock_pr.issue.comments = mock_comments
+            mock_reviews = MagicMock(
+                return_value=(
+                    SimpleNamespace(
+                        user=reviewer,
+                        submitted_at=datetime.fromisoformat("2023-01-03T00:00:00Z"),
+                    ),
+                )
+            )
+            mock_pr.issue.pull_request.return_value = MagicMock(
+                draft=False, reviews=mock_reviews
+            )
+            return mock_pr, mock_comments, mock_reviews
+
+        comment = SimpleNamespace(
+            user=reviewer,
+            created_at=datetime.fromisoformat("2023-01-02T00:00:00Z"),
+        )
+        commented_pr, commented_comments, commented_reviews = make_pull_request(
+            1, (comment,)
+        )
+        uncommented_pr, uncommented_comments, uncommented_reviews = make_pull_request(
+            2, ()
+        )
+
+        result_issues_with_metrics, _, _ = get_per_issue_metrics(
+            [commented_pr, uncommented_pr],
+            env_vars=get_env_vars(test=True),
+            max_comments_to_eval=30,
+        )
+
+        commented_comments.assert_called_once_with(
+            number=30, sort="created", direction="asc"
+        )
+        commented_reviews.assert_called_once_with(number=50)
+        uncommented_comments.assert_not_called()
+        uncommented_reviews.assert_called_once_with(number=50)
+        self.assertEqual(
+            [issue.time_to_first_response for issue in result_issues_with_metrics],
+            [timedelta(days=1), timedelta(days=2)],
+        )
+        self.assertEqual(
+            [issue.mentor_activity for issue in result_issues_with_metrics],
+            [{"bob": 2}, {"bob": 1}],
+        )
+
+    @patch.dict(
+        os.environ,
+        {
+            "GH_TOKEN": "test_token",
+            "SEARCH_QUERY": "is:pr is:open repo:user/repo",
+            "ENABLE_MENTOR_COUNT": "true",
+        },
+    )
+    def test_get_per_issue_metrics_shared_reviews_with_ghost_user(self):
+        """
+        Test that a ghost reviewer past the reviews each measurement reads
+        makes them fall back to fetching their own reviews
+        """
+        reviewer = SimpleNamespace(login="bob", type="User")
+
+        def reviews_with_ghost_user(number):
+            # Reviews 1 to 21 are readable, review 22 was left by a ghost user
+            for _ in range(min(number, 21)):
+                yield SimpleNamespace(
+                    user=reviewer,
+                    submitted_at=datetime.fromisoformat("2023-01-03T00:00:00Z"),
+                )
+            if number > 21:
+                raise TypeError("'NoneType' object is not subscriptable")
+
+        mock_pr = MagicMock(
+            title="PR 1",
+            html_url="https://github.com/user/repo/pull/1",
+            user={"login": "alice"},
+            state="open",
+            created_at="2023-01-01T00:00:00Z",
+        )
+        mock_pr.issue.user = SimpleNamespace(login="alice", type="User")
+        mock_pr.issue.pull_request_urls = {"url": "pr/1"}
+        mock_pr.issue.events.return_value = ()
+        mock_pr.issue.comments_count = 0
+        mock_reviews = MagicMock(side_effect=reviews_with_ghost_user)
+        mock_pr.issue.pull_request.return_value = MagicMock(
+            draft=False, reviews=mock_reviews
+        )
+
+        result_issues_with_metrics, _, _ = get_per_issue_metrics(
+            [mock_pr],
+            env_vars=get_env_vars(test=True),
+        )
+
+        self.assertEqual(
+            mock_reviews.call_args_list,
+            [call(number=50), call(number=50), call(number=20)],
+        )
+        self.assertEqual(
+            result_issues_with_metrics[0].time_to_first_response, timedelta(days=2)
+        )
+        self.assertEqual(result_issues_with_metrics[0].mentor_activity, {"bob": 20})
+
 
 class TestDiscussionMetrics(unittest.TestCase):
     """Test suite for the discussion_metrics function."""
@@ -1,11 +1,10 @@
 """ Unit tests for labels.py """
 
 import unittest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
 import github3
-import pytz
 from classes import IssueWithMetrics
 from labels import get_label_events, get_label_metrics, get_stats_time_in_labels
 
@@ -23,28 +22,28 @@ class TestLabels(unittest.TestCase):
             MagicMock(
                 event="labeled",
                 label={"name": "bug"},
-                created_at=datetime(2021, 1, 1, tzinfo=pytz.UTC),
+                created_at=datetime(2021, 1, 1, tzinfo=timezone.utc),
             ),
             MagicMock(
                 event="labeled",
                 label={"name": "feature"},
-                created_at=datetime(2021, 1, 2, tzinfo=pytz.UTC),
+                created_at=datetime(2021, 1, 2, tzinfo=timezone.utc),
             ),
             MagicMock(
                 event="unlabeled",
                 label={"name": "bug"},
-                created_at=datetime(2021, 1, 3, tzinfo=pytz.UTC),
+                created_at=datetime(2021, 1, 3, tzinfo=timezone.utc),
             ),
             MagicMock(
                 event="labeled",
                 label={"name": "bug"},
-                created_at=datetime(2021, 1, 4, tzinfo=pytz.UTC),
+                created_at=datetime(2021, 1, 4, tzinfo=timezone.utc),
             ),
             # Label labeled after issue close date
             MagicMock(
                 event="labeled",
                 label={"name": "foo"},
-                created_at=datetime(2021, 1, 20, tzinfo=pytz.UTC),
+                created_at=datetime(2021, 1, 20, tzinfo=timezone.utc),
             ),
         ]
 
@@ -71,19 +70,19 @@ class TestLabels(unittest.TestCase):
         metrics = get_label_metrics(self.issue, labels)
         self.assertLessEqual(
             metrics["bug"],
-            datetime.now(pytz.utc) - datetime(2021, 1, 2, tzinfo=pytz.UTC),
+            datetime.now(timezone.utc) - datetime(2021, 1, 2, tzinfo=timezone.utc),
         )
         self.assertGreater(
             metrics["bug"],
-            datetime.now(pytz.utc) - datetime(2021, 1, 3, tzinfo=pytz.UTC),
+            datetime.now(timezone.utc) - datetime(2021, 1, 3, tzinfo=timezone.utc),
         )
         self.assertLessEqual(
             metrics["feature"],
-            datetime.now(pytz.utc) - datetime(2021, 1, 2, tzinfo=pytz.UTC),
+            datetime.now(timezone.utc) - datetime(2021, 1, 2, tzinfo=timezone.utc),
         )
         self.assertGreater(
             metrics["feature"],
-            datetime.now(pytz.utc) - datetime(2021, 1, 4, tzinfo=pytz.UTC),
+            datetime.now(timezone.utc) - datetime(2021, 1, 4, tzinfo=timezone.utc),
         )
 
     def test_get_label_metrics_closed_issue_labeled_past_closed_at(self):
@@ -13,7 +13,7 @@ Classes:
 
 import unittest
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 from classes import IssueWithMetrics
 from most_active_mentors import count_comments_per_user, get_mentor_count
@@ -31,7 +31,8 @@ class TestCountCommentsPerUser(unittest.TestCase):
 
         """
         # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
+        mock_issue1 = Mock(spec_set=["comments", "created_at", "issue"])
+        mock_issue1.issue = Mock(spec_set=["comments", "user"])
         mock_issue1.comments = 2
         mock_issue1.issue.user.login = "issue_owner"
         mock_issue1.created_at = "2023-01-01T00:00:00Z"
@@ -39,7 +40,7 @@ class TestCountCommentsPerUser(unittest.TestCase):
         # Set up 21 mock GitHub issue comments - only 20 should be counted
         mock_issue1.issue.comments.return_value = []
         for i in range(22):
-            mock_comment1 = MagicMock()
+            mock_comment1 = Mock(spec_set=["created_at", "user"])
             mock_comment1.user.login = "very_active_user"
             mock_comment1.created_at = datetime.fromisoformat(
                 f"2023-01-02T{i:02d}:00:00Z"
@@ -57,7 +58,8 @@ class TestCountCommentsPerUser(unittest.TestCase):
     def test_count_comments_per_user_with_ignores(self):
         """Test that count_comments_per_user correctly counts user comments with some users ignored."""
         # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
+        mock_issue1 = Mock(spec_set=["comments", "created_at", "issue"])
+        mock_issue1.issue = Mock(spec_set=["comments", "user"])
         mock_issue1.comments = 2
         mock_issue1.issue.user.login = "issue_owner"
         mock_issue1.created_at = "2023-01-01T00:00:00Z"
@@ -65,7 +67,7 @@ class TestCountCommentsPerUser(unittest.TestCase):
         # Set up mock GitHub issue comments by several users
         mock_issue1.issue.comments.return_value = []
         for i in range(5):
-            mock_comment1 = MagicMock()
+            mock_comment1 = Mock(spec_set=["created_at", "user"])
             mock_comment1.user.login = "very_active_user"
             mock_comment1.created_at = datetime.fromisoformat(
                 f"2023-01-02T{i:02d}:00:00Z"
@@ -73,7 +75,7 @@ class TestCountCommentsPerUser(unittest.TestCase):
             # pylint: disable=maybe-no-member
             mock_issue1.issue.comments.return_value.append(mock_comment1)
         for i in range(5):
-            mock_comment1 = MagicMock()
+            mock_comment1 = Mock(spec_set=["created_at", "user"])
             mock_comment1.user.login = "very_active_user_ignored"
             mock_comment1.created_at = datetime.fromisoformat(
                 f"2023-01-02T{i:02d}:00:00Z"
@@ -93,6 +95,47 @@ class TestCountCommentsPerUser(unittest.TestCase):
         self.assertEqual(result, expected_result)
         self.assertNotIn("very_active_user_ignored", result)
 
+    def test_count_comments_per_user_prefetched(self):
+        """Test that count_comments_per_user counts only the first
+        max_comments_to_eval of the comments and reviews it is given, without
+        fetching them again."""
+        mock_issue1 = Mock(spec_set=["issue"])
+        mock_comments = Mock()
+        mock_issue1.issue = Mock(spec_set=["comments", "user"], comments=mock_comments)
+        mock_issue1.issue.user.login = "issue_owner"
+        mock_reviews = Mock()
+        mock_pull_request = Mock(spec_set=["reviews"], reviews=mock_reviews)
+
+        comments = []
+        reviews = []
+        for i in range(4):
+            comment = Mock(spec_set=["created_at", "user"])
+            comment.user.login = f"commenter_{i}"
+            comment.created_at = datetime.fromisoformat(f"2023-01-02T{i:02d}:00:00Z")
+            comments.append(comment)
+            review = Mock(spec_set=["submitted_at", "user"])
+            review.user.login = f"reviewer_{i}"
+            review.submitted_at = datetime.fromisoformat(f"2023-01-03T{i:02d}:00:00Z")
+            reviews.append(review)
+
+        result = count_comments_per_user(
+            mock_issue1,
+            pull_request=mock_pull_request,
+            max_comments_to_eval=2,
+            comments=comments,
+            reviews=reviews,
+        )
+        expected_result = {
+            "commenter_0": 1,
+            "commenter_1": 1,
+            "reviewer_0": 1,
+            "reviewer_1": 1,
+        }
+
+        self.assertEqual(result, expected_result)
+        mock_comments.assert_not_called()
+        mock_reviews.assert_not_called()
+
     def test_get_mentor_count(self):
         """Test that get_mentor_count correctly counts comments per user."""
         mentor_activity = {"sue": 15, "bob": 10}
@@ -0,0 +1,53 @@
+"""A module containing unit tests for the stats module.
+
+Classes:
+    TestGetDurationStats: A class to test the get_duration_stats function.
+
+"""
+
+import unittest
+from datetime import timedelta
+
+from stats import get_duration_stats
+
+
+class TestGetDurationStats(unittest.TestCase):
+    """Test suite for the get_duration_stats function."""
+
+    def test_get_duration_stats(self):
+        """Test that the average, median and 90th percentile are rounded to seconds."""
+        result = get_duration_stats((10.0, 20.0, 40.0))
+        expected_result = {
+            "avg": timedelta(seconds=23),
+            "med": timedelta(seconds=20),
+            "90p": timedelta(seconds=36),
+        }
+        self.assertEqual(result, expected_result)
+
+    def test_get_duration_stats_from_generator(self):
+        """Test that durations can be streamed from a one-shot generator."""
+        result = get_duration_stats(float(seconds) for seconds in range(1, 4))
+        self.assertEqual(result["avg"], timedelta(seconds=2))
+
+    def test_get_duration_stats_many_durations(self):
+        """Test the stats over a large input of 0 to 10,000 seconds."""
+        result = get_duration_stats(float(seconds) for seconds in range(10_001))
+        expected_result = {
+            "avg": timedelta(seconds=5000),
+            "med": timedelta(seconds=5000),
+            "90p": timedelta(seconds=9000),
+        }
+        self.assertEqual(result, expected_result)
+
+    def test_get_duration_stats_single_duration(self):
+        """Test that a single duration is its own average, median and 90th percentile."""
+        result = get_duration_stats((42.0,))
+        self.assertEqual(set(result.values()), {timedelta(seconds=42)})
+
+    def test_get_duration_stats_no_durations(self):
+        """Test that the function returns None when there are no durations."""
+        self.assertIsNone(get_duration_stats(()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,130 +1,158 @@
 """A test suite for the measure_time_in_draft function."""
 
 import unittest
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
-import pytz
 from time_in_draft import get_stats_time_in_draft, measure_time_in_draft
 
+Event = namedtuple("Event", ["event", "created_at"])
+
+UTC = timezone.utc
+# DAY[n] is midnight UTC on 2021-01-n
+DAY = {day: datetime(2021, 1, day, tzinfo=UTC) for day in range(1, 8)}
+NOW = DAY[4]
+
+SINGLE_DRAFT_INTERVAL_EVENTS = (
+    Event("converted_to_draft", DAY[1]),
+    Event("ready_for_review", DAY[3]),
+)
+MULTIPLE_DRAFT_INTERVAL_EVENTS = (
+    Event("converted_to_draft", DAY[1]),
+    Event("ready_for_review", DAY[3]),
+    Event("converted_to_draft", DAY[5]),
+    Event("ready_for_review", DAY[7]),
+)
+ONGOING_DRAFT_EVENTS = (Event("converted_to_draft", DAY[1]),)
+# A pull request opened as a draft on DAY[1] has no converted_to_draft event
+OPENED_AS_DRAFT_EVENTS = (
+    Event("ready_for_review", DAY[3]),
+    Event("converted_to_draft", DAY[5]),
+    Event("ready_for_review", DAY[6]),
+)
+DRAFT_PULL_REQUEST = SimpleNamespace(draft=True)
+READY_PULL_REQUEST = SimpleNamespace(draft=False)
+
+ISSUES_WITH_DRAFT_TIME = (
+    SimpleNamespace(time_in_draft=timedelta(days=1)),
+    SimpleNamespace(time_in_draft=timedelta(days=2)),
+    SimpleNamespace(time_in_draft=timedelta(days=3)),
+)
+ISSUES_WITHOUT_DRAFT_TIME = (SimpleNamespace(time_in_draft=None),) * 2
+EXPECTED_STATS_WITH_DRAFT_TIME = {
+    "avg": timedelta(days=2),
+    "med": timedelta(days=2),
+    "90p": timedelta(days=2, seconds=69120),
+}
+
+
+class _FakeIssue:
+    """The part of a github3 issue that measure_time_in_draft reads."""
+
+    __slots__ = ("state", "created_at", "event_list")
+
+    def __init__(self, state, event_list=(), created_at=DAY[1]):
+        self.state = state
+        self.created_at = created_at
+        self.event_list = event_list
+
+    def events(self, **_kwargs):
+        """Return the issue events, ignoring the paging arguments."""
+        return self.event_list
+
+
+def _make_issue(state, events):
+    """Build a search result whose issue.events() returns the given events."""
+    return SimpleNamespace(issue=_FakeIssue(state, events))
+
 
 class TestMeasureTimeInDraft(unittest.TestCase):
     """
     Unit tests for the measure_time_in_draft function.
     """
 
-    def setUp(self):
-        """
-        Setup common test data and mocks.
-        """
-        self.issue = MagicMock()
-        self.issue.issue.state = "open"
+    # (name, issue state, events, expected time in draft)
+    CASES = (
+        ("one draft interval", "open", SINGLE_DRAFT_INTERVAL_EVENTS, timedelta(days=2)),
+        (
+            "multiple draft intervals",
+            "open",
+            MULTIPLE_DRAFT_INTERVAL_EVENTS,
+            timedelta(days=4),
+        ),
+        ("ongoing draft", "open", ONGOING_DRAFT_EVENTS, timedelta(days=3)),
+        ("no draft events", "open", (), None),
+        ("ongoing draft on a closed issue", "closed", ONGOING_DRAFT_EVENTS, None),
+    )
+
+    def test_measure_time_in_draft(self):
+        """
+        Test measure_time_in_draft against each case in CASES.
+        """
+        for name, state, events, expected in self.CASES:
+            with self.subTest(case=name):
+                result = measure_time_in_draft(_make_issue(state, events), now=NOW)
+                self.assertEqual(result, expected)
+
+    def test_measure_time_in_draft_opened_as_draft(self):
+        """
+        Test measure_time_in_draft counts the time from creation for a pull request opened as a draft.
+        """
+        for name, events, pull_request, expected in (
+            (
+                "readied later",
+                OPENED_AS_DRAFT_EVENTS,
+                READY_PULL_REQUEST,
+                timedelta(days=3),
+            ),
+            ("still in draft", (), DRAFT_PULL_REQUEST, timedelta(days=3)),
+            ("never a draft", (), READY_PULL_REQUEST, None),
+        ):
+            with self.subTest(case=name):
+                result = measure_time_in_draft(
+                    _make_issue("open", events), pull_request, now=NOW
+                )
+                self.assertEqual(result, expected)
 
-    def test_time_in_draft_with_ready_for_review(self):
+    def test_measure_time_in_draft_with_iterator_events(self):
         """
-        Test measure_time_in_draft with one draft and review interval.
+        Test measure_time_in_draft reads events from a one-shot iterator in a single pass.
         """
-        self.issue.events.return_value = [
-            MagicMock(
-                event="converted_to_draft",
-                created_at=datetime(2021, 1, 1, tzinfo=pytz.utc),
-            ),
-            MagicMock(
-                event="ready_for_review",
-                created_at=datetime(2021, 1, 3, tzinfo=pytz.utc),
-            ),
-        ]
-        result = measure_time_in_draft(self.issue)
-        expected = timedelta(days=2)
-        self.assertEqual(result, expected, "The time in draft should be 2 days.")
+        issue = _make_issue("open", iter(MULTIPLE_DRAFT_INTERVAL_EVENTS))
+        result = measure_time_in_draft(issue, now=NOW)
+        self.assertEqual(result, timedelta(days=4))
 
-    def test_time_in_draft_without_ready_for_review(self):
+    def test_measure_time_in_draft_with_prefetched_events(self):
         """
-        Test measure_time_in_draft when ready_for_review_at is not provided and issue is still open.
+        Test measure_time_in_draft uses events the caller already fetched instead of the issue's.
         """
-        self.issue.events.return_value = [
-            MagicMock(
-                event="converted_to_draft",
-                created_at=datetime(2021, 1, 1, tzinfo=pytz.utc),
-            ),
-        ]
-        now = datetime(2021, 1, 4, tzinfo=pytz.utc)
-        with unittest.mock.patch("time_in_draft.datetime") as mock_datetime:
-            mock_datetime.now.return_value = now
-            result = measure_time_in_draft(self.issue)
-            expected = timedelta(days=3)
-            self.assertEqual(result, expected, "The time in draft should be 3 days.")
-
-    def test_time_in_draft_multiple_intervals(self):
-        """
-        Test measure_time_in_draft with multiple draft intervals.
-        """
-        self.issue.events.return_value = [
-            MagicMock(
-                event="converted_to_draft",
-                created_at=datetime(2021, 1, 1, tzinfo=pytz.utc),
-            ),
-            MagicMock(
-                event="ready_for_review",
-                created_at=datetime(2021, 1, 3, tzinfo=pytz.utc),
-            ),
-            MagicMock(
-                event="converted_to_draft",
-                created_at=datetime(2021, 1, 5, tzinfo=pytz.utc),
-            ),
-            MagicMock(
-                event="ready_for_review",
-                created_at=datetime(2021, 1, 7, tzinfo=pytz.utc),
-            ),
-        ]
-        result = measure_time_in_draft(self.issue)
-        expected = timedelta(days=4)
-        self.assertEqual(result, expected, "The total time in draft should be 4 days.")
+        issue = _make_issue("open", ())
+        result = measure_time_in_draft(
+            issue, now=NOW, events=MULTIPLE_DRAFT_INTERVAL_EVENTS
+        )
+        self.assertEqual(result, timedelta(days=4))
 
-    def test_time_in_draft_ongoing_draft(self):
+    def test_measure_time_in_draft_with_ghost_user(self):
         """
-        Test measure_time_in_draft with an ongoing draft interval.
+        Test that measure_time_in_draft returns None when the events cannot be read.
         """
-        self.issue.events.return_value = [
-            MagicMock(
-                event="converted_to_draft",
-                created_at=datetime(2021, 1, 1, tzinfo=pytz.utc),
-            ),
-        ]
-        with unittest.mock.patch("time_in_draft.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2021, 1, 4, tzinfo=pytz.utc)
-            result = measure_time_in_draft(self.issue)
-            expected = timedelta(days=3)
-            self.assertEqual(
-                result, expected, "The ongoing draft time should be 3 days."
-            )
-
-    def test_time_in_draft_no_draft_events(self):
-        """
-        Test measure_time_in_draft with no draft-related events.
-        """
-        self.issue.events.return_value = []
-        result = measure_time_in_draft(self.issue)
-        self.assertIsNone(
-            result, "The result should be None when there are no draft events."
+
+        def ghost_user_events():
+            yield Event("converted_to_draft", DAY[1])
+            raise TypeError("'NoneType' object is not subscriptable")
+
+        result = measure_time_in_draft(
+            _make_issue("open", ()), now=NOW, events=ghost_user_events()
         )
+        self.assertIsNone(result)
 
-    def test_time_in_draft_without_ready_for_review_and_closed(self):
+    def test_measure_time_in_draft_defaults_to_current_time(self):
         """
-        Test measure_time_in_draft for a closed issue with an ongoing draft and ready_for_review_at is not provided.
+        Test measure_time_in_draft measures an ongoing draft up to now when no time is given.
         """
-        self.issue.events.return_value = [
-            MagicMock(
-                event="converted_to_draft",
-                created_at=datetime(2021, 1, 1, tzinfo=pytz.utc),
-            ),
-        ]
-        self.issue.issue.state = "closed"
-        result = measure_time_in_draft(self.issue)
-        self.assertIsNone(
-            result,
-            "The result should be None for a closed issue with an ongoing draft.",
-        )
+        result = measure_time_in_draft(_make_issue("open", ONGOING_DRAFT_EVENTS))
+        self.assertGreater(result, NOW - ONGOING_DRAFT_EVENTS[0].created_at)
 
 
 class TestGetStatsTimeInDraft(unittest.TestCase):
@@ -136,47 +164,24 @@ class TestGetStatsTimeInDraft(unittest.TestCase):
         """
         Test get_stats_time_in_draft with valid draft times.
         """
-        issues = [
-            MagicMock(time_in_draft=timedelta(days=1)),
-            MagicMock(time_in_draft=timedelta(days=2)),
-            MagicMock(time_in_draft=timedelta(days=3)),
-        ]
-
-        result = get_stats_time_in_draft(issues)
-        expected = {
-            "avg": timedelta(days=2),
-            "med": timedelta(days=2),
-            "90p": timedelta(days=2, seconds=69120),
-        }
-
+        result = get_stats_time_in_draft(ISSUES_WITH_DRAFT_TIME)
         self.assertEqual(
-            result, expected, "The statistics for time in draft are incorrect."
-        )
-
-    def test_get_stats_time_in_draft_no_data(self):
-        """
-        Test get_stats_time_in_draft with no draft times.
-        """
-        issues = [
-            MagicMock(time_in_draft=None),
-            MagicMock(time_in_draft=None),
-        ]
-
-        result = get_stats_time_in_draft(issues)
-        self.assertIsNone(
-            result, "The result should be None when there are no draft times."
+            result,
+            EXPECTED_STATS_WITH_DRAFT_TIME,
+            "The statistics for time in draft are incorrect.",
         )
 
-    def test_get_stats_time_in_draft_empty_list(self):
+    def test_get_stats_time_in_draft_without_draft_times(self):
         """
-        Test get_stats_time_in_draft with an empty list of issues.
+        Test get_stats_time_in_draft returns None when no issue has a draft time.
         """
-        issues = []
-
-        result = get_stats_time_in_draft(issues)
-        self.assertIsNone(
-            result, "The result should be None when the list of issues is empty."
-        )
+        for name, issues in (
+            ("no draft times", ISSUES_WITHOUT_DRAFT_TIME),
+            ("zero draft time", (SimpleNamespace(time_in_draft=timedelta(0)),)),
+            ("empty list", ()),
+        ):
+            with self.subTest(case=name):
+                self.assertIsNone(get_stats_time_in_draft(issues))
 
 
 if __name__ == "__main__":
@@ -16,6 +16,25 @@ class TestGetAverageTimeToAnswer(unittest.TestCase):
     - test_returns_stats_time_to_answer
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only issue lists shared by the tests."""
+        cls.issues_without_time_to_answer = [
+            IssueWithMetrics("issue1", None, None),
+            IssueWithMetrics("issue2", None, None),
+        ]
+        cls.issues_with_time_to_answer = [
+            IssueWithMetrics(
+                "issue1", "url1", "alice", None, None, timedelta(seconds=10)
+            ),
+            IssueWithMetrics(
+                "issue2", "url2", "bob", None, None, timedelta(seconds=20)
+            ),
+            IssueWithMetrics(
+                "issue3", "url3", "carol", None, None, timedelta(seconds=30)
+            ),
+        ]
+
     def test_returns_none_for_empty_list(self):
         """Tests that the function returns None when given an empty list of issues."""
         # Arrange
@@ -32,14 +51,8 @@ class TestGetAverageTimeToAnswer(unittest.TestCase):
         Tests that the function returns None when given a list of
         issues with no time to answer.
         """
-        # Arrange
-        issues_with_metrics = [
-            IssueWithMetrics("issue1", None, None),
-            IssueWithMetrics("issue2", None, None),
-        ]
-
         # Act
-        result = get_stats_time_to_answer(issues_with_metrics)
+        result = get_stats_time_to_answer(self.issues_without_time_to_answer)
 
         # Assert
         self.assertIsNone(result)
@@ -50,21 +63,8 @@ class TestGetAverageTimeToAnswer(unittest.TestCase):
         time to answer for a list of issues with time to answer.
         """
 
-        # Arrange
-        issues_with_metrics = [
-            IssueWithMetrics(
-                "issue1", "url1", "alice", None, None, timedelta(seconds=10)
-            ),
-            IssueWithMetrics(
-                "issue2", "url2", "bob", None, None, timedelta(seconds=20)
-            ),
-            IssueWithMetrics(
-                "issue3", "url3", "carol", None, None, timedelta(seconds=30)
-            ),
-        ]
-
         # Act
-        result = get_stats_time_to_answer(issues_with_metrics)["avg"]
+        result = get_stats_time_to_answer(self.issues_with_time_to_answer)["avg"]
 
         # Assert
         self.assertEqual(result, timedelta(seconds=20))
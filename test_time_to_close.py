@@ -11,61 +11,64 @@ Classes:
 """
 
 import unittest
-from datetime import timedelta
-from unittest.mock import MagicMock
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
 
 from classes import IssueWithMetrics
 from time_to_close import get_stats_time_to_close, measure_time_to_close
 
+CREATED_AT_ISO = "2021-01-01T00:00:00Z"
+CLOSED_AT_ISO = "2021-01-03T00:00:00Z"
+CREATED_AT = datetime(2021, 1, 1, tzinfo=timezone.utc)
+CLOSED_AT = datetime(2021, 1, 3, tzinfo=timezone.utc)
+TWO_DAYS = timedelta(days=2)
+
+ISSUES_WITH_TIME_TO_CLOSE = (
+    IssueWithMetrics(
+        "Issue 1",
+        "https://github.com/user/repo/issues/1",
+        "alice",
+        None,
+        TWO_DAYS,
+    ),
+    IssueWithMetrics(
+        "Issue 2",
+        "https://github.com/user/repo/issues/2",
+        "bob",
+        None,
+        timedelta(days=4),
+    ),
+    IssueWithMetrics(
+        "Issue 3", "https://github.com/user/repo/issues/3", "carol", None, None
+    ),
+)
+ISSUES_WITHOUT_TIME_TO_CLOSE = (
+    IssueWithMetrics(
+        "Issue 1", "https://github.com/user/repo/issues/1", "alice", None, None
+    ),
+    IssueWithMetrics(
+        "Issue 2", "https://github.com/user/repo/issues/2", "bob", None, None
+    ),
+    IssueWithMetrics(
+        "Issue 3", "https://github.com/user/repo/issues/3", "carol", None, None
+    ),
+)
+
 
 class TestGetAverageTimeToClose(unittest.TestCase):
     """Test suite for the get_stats_time_to_close function."""
 
     def test_get_stats_time_to_close(self):
         """Test that the function correctly calculates the average time to close."""
-        # Create mock data
-        issues_with_metrics = [
-            IssueWithMetrics(
-                "Issue 1",
-                "https://github.com/user/repo/issues/1",
-                "alice",
-                None,
-                timedelta(days=2),
-            ),
-            IssueWithMetrics(
-                "Issue 2",
-                "https://github.com/user/repo/issues/2",
-                "bob",
-                None,
-                timedelta(days=4),
-            ),
-            IssueWithMetrics(
-                "Issue 3", "https://github.com/user/repo/issues/3", "carol", None, None
-            ),
-        ]
-
         # Call the function and check the result
-        result = get_stats_time_to_close(issues_with_metrics)["avg"]
+        result = get_stats_time_to_close(ISSUES_WITH_TIME_TO_CLOSE)["avg"]
         expected_result = timedelta(days=3)
         self.assertEqual(result, expected_result)
 
     def test_get_stats_time_to_close_no_issues(self):
         """Test that the function returns None if there are no issues with time to close."""
-        # Create mock data
-        issues_with_metrics = [
-            IssueWithMetrics(
-                "Issue 1", "https://github.com/user/repo/issues/1", "alice", None, None
-            ),
-            IssueWithMetrics(
-                "Issue 2", "https://github.com/user/repo/issues/2", "bob", None, None
-            ),
-            IssueWithMetrics(
-                "Issue 3", "https://github.com/user/repo/issues/3", "carol", None, None
-            ),
-        ]
-
         # Call the function and check the result
-        result = get_stats_time_to_close(issues_with_metrics)
+        result = get_stats_time_to_close(ISSUES_WITHOUT_TIME_TO_CLOSE)
         expected_result = None
         self.assertEqual(result, expected_result)
 
@@ -76,20 +79,33 @@ class TestMeasureTimeToClose(unittest.TestCase):
     def test_measure_time_to_close(self):
         """Test that the function correctly measures the time to close an issue."""
         # Create a mock issue object
-        issue = MagicMock()
+        issue = Mock(spec_set=["state", "created_at", "closed_at"])
+        issue.state = "closed"
+        issue.created_at = CREATED_AT
+        issue.closed_at = CLOSED_AT
+
+        # Call the function and check the result
+        result = measure_time_to_close(issue, None)
+        expected_result = TWO_DAYS
+        self.assertEqual(result, expected_result)
+
+    def test_measure_time_to_close_iso_strings(self):
+        """Test that the function parses ISO 8601 timestamps on an issue."""
+        # Create a mock issue object
+        issue = Mock(spec_set=["state", "created_at", "closed_at"])
         issue.state = "closed"
-        issue.created_at = "2021-01-01T00:00:00Z"
-        issue.closed_at = "2021-01-03T00:00:00Z"
+        issue.created_at = CREATED_AT_ISO
+        issue.closed_at = CLOSED_AT_ISO
 
         # Call the function and check the result
         result = measure_time_to_close(issue, None)
-        expected_result = timedelta(days=2)
+        expected_result = TWO_DAYS
         self.assertEqual(result, expected_result)
 
     def test_measure_time_to_close_returns_none(self):
         """Test that the function returns None if the issue is not closed."""
         # Create a mock issue object
-        issue = MagicMock()
+        issue = Mock(spec_set=["state"])
         issue.state = "open"
 
         # Call the function and check that it returns None
@@ -101,10 +117,10 @@ class TestMeasureTimeToClose(unittest.TestCase):
         """
         # Create an issue dictionary with createdAt and closedAt fields
         issue = {}
-        issue["createdAt"] = "2021-01-01T00:00:00Z"
-        issue["closedAt"] = "2021-01-03T00:00:00Z"
+        issue["createdAt"] = CREATED_AT_ISO
+        issue["closedAt"] = CLOSED_AT_ISO
 
         # Call the function and check the result
         result = measure_time_to_close(None, issue)
-        expected_result = timedelta(days=2)
+        expected_result = TWO_DAYS
         self.assertEqual(result, expected_result)
@@ -2,7 +2,7 @@
 
 This module contains unit tests for the measure_time_to_first_response and
 get_stats_time_to_first_response functions in the time_to_first_response module.
-The tests use mock GitHub issues and comments to test the functions' behavior.
+The tests use lightweight fake GitHub issues and comments to test the functions' behavior.
 
 Classes:
     TestMeasureTimeToFirstResponse: A class to test the measure_time_to_first_response function.
@@ -12,8 +12,10 @@ Classes:
 """
 
 import unittest
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Union
+from unittest.mock import Mock
 
 from classes import IssueWithMetrics
 from time_to_first_response import (
@@ -21,408 +23,265 @@ from time_to_first_response import (
     measure_time_to_first_response,
 )
 
+# Response timestamps shared by the tests, parsed once at import
+JAN_02 = datetime(2023, 1, 2, tzinfo=timezone.utc)
+JAN_02_NOON = datetime(2023, 1, 2, 12, tzinfo=timezone.utc)
+JAN_03 = datetime(2023, 1, 3, tzinfo=timezone.utc)
+JAN_04 = datetime(2023, 1, 4, tzinfo=timezone.utc)
+JAN_04_NOON = datetime(2023, 1, 4, 12, tzinfo=timezone.utc)
+JAN_05 = datetime(2023, 1, 5, tzinfo=timezone.utc)
 
-class TestMeasureTimeToFirstResponse(unittest.TestCase):
-    """Test the measure_time_to_first_response function."""
+ONE_DAY = timedelta(days=1)
+TWO_DAYS = timedelta(days=2)
+THREE_DAYS = timedelta(days=3)
 
-    def test_measure_time_to_first_response(self):
-        """Test that measure_time_to_first_response calculates the correct time.
-
-        This test mocks the GitHub connection and issue comments, and checks that
-        measure_time_to_first_response calculates the correct time to first response.
-
-        """
-        # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 2
-        mock_issue1.issue.user.login = "issue_owner"
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
-
-        # Set up the mock GitHub issue comments
-        mock_comment1 = MagicMock()
-        mock_comment1.created_at = datetime.fromisoformat("2023-01-02T00:00:00Z")
-        mock_comment2 = MagicMock()
-        mock_comment2.created_at = datetime.fromisoformat("2023-01-02T12:00:00Z")
-        mock_issue1.issue.comments.return_value = [mock_comment1, mock_comment2]
-
-        # Call the function
-        result = measure_time_to_first_response(mock_issue1, None)
-        expected_result = timedelta(days=1)
-
-        # Check the results
-        self.assertEqual(result, expected_result)
-
-    def test_measure_time_to_first_response_no_comments(self):
-        """Test that measure_time_to_first_response returns empty for an issue with no comments."""
-        # Set up mock issues with no comments
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 0
-        mock_issue1.issue.user.login = "issue_owner"
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
-
-        # Call the function
-        result = measure_time_to_first_response(mock_issue1, None)
-        expected_result = None
-
-        # Check the results
-        self.assertEqual(result, expected_result)
-
-    def test_measure_time_to_first_response_with_pull_request_comments(self):
-        """Test that measure_time_to_first_response with pull request comments."""
-
-        # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 2
-        mock_issue1.issue.user.login = "issue_owner"
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
-
-        # Set up the mock GitHub pull request comments
-        mock_pr_comment1 = MagicMock()
-        mock_pr_comment1.submitted_at = datetime.fromisoformat(
-            "2023-01-02T00:00:00Z"
-        )  # first response
-        mock_pr_comment2 = MagicMock()
-        mock_pr_comment2.submitted_at = datetime.fromisoformat("2023-01-02T12:00:00Z")
-        mock_pull_request = MagicMock()
-        mock_pull_request.reviews.return_value = [mock_pr_comment1, mock_pr_comment2]
-
-        # Call the function
-        result = measure_time_to_first_response(
-            mock_issue1, None, mock_pull_request, None
-        )
-        expected_result = timedelta(days=1)
-
-        # Check the results
-        self.assertEqual(result, expected_result)
-
-    def test_measure_time_to_first_response_issue_comment_faster(self):
-        """Test that measure_time_to_first_response issue comment faster."""
-
-        # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 2
-        mock_issue1.issue.user.login = "issue_owner"
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
-
-        # Set up the mock GitHub issue comment
-        mock_comment1 = MagicMock()
-        mock_comment1.created_at = datetime.fromisoformat(
-            "2023-01-02T00:00:00Z"
-        )  # first response
-        mock_issue1.issue.comments.return_value = [mock_comment1]
-
-        # Set up the mock GitHub pull request comment
-        mock_pr_comment1 = MagicMock()
-        mock_pr_comment1.submitted_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
-        mock_pull_request = MagicMock()
-        mock_pull_request.reviews.return_value = [mock_pr_comment1]
-
-        # Call the function
-        result = measure_time_to_first_response(
-            mock_issue1, None, mock_pull_request, None
-        )
-        expected_result = timedelta(days=1)
-
-        # Check the results
-        self.assertEqual(result, expected_result)
-
-    def test_measure_time_to_first_response_pull_request_comment_faster(self):
-        """Test that measure_time_to_first_response pull request comment faster."""
-
-        # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 2
-        mock_issue1.issue.user.login = "issue_owner"
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
-
-        # Set up the mock GitHub pull issue comment
-        mock_comment1 = MagicMock()
-        mock_comment1.created_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
-        mock_issue1.issue.comments.return_value = [mock_comment1]
-
-        # Set up the mock GitHub pull request comment
-        mock_pr_comment1 = MagicMock()
-        mock_pr_comment1.submitted_at = datetime.fromisoformat(
-            "2023-01-02T00:00:00Z"
-        )  # first response
-        mock_pull_request = MagicMock()
-        mock_pull_request.reviews.return_value = [mock_pr_comment1]
-
-        # Call the function
-        result = measure_time_to_first_response(
-            mock_issue1, None, mock_pull_request, None
-        )
-        expected_result = timedelta(days=1)
-
-        # Check the results
-        self.assertEqual(result, expected_result)
-
-    def test_measure_time_to_first_response_pull_request_comment_ignore_before_ready(
-        self,
-    ):
-        """Test that measure_time_to_first_response ignores comments from before the pull request was ready for review."""
-        # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 4
-        mock_issue1.issue.user.login = "issue_owner"
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
-
-        # Set up the mock GitHub issue comments (one ignored, one not ignored)
-        mock_comment1 = MagicMock()
-        mock_comment1.created_at = datetime.fromisoformat("2023-01-02T00:00:00Z")
-        mock_comment2 = MagicMock()
-        mock_comment2.created_at = datetime.fromisoformat("2023-01-05T00:00:00Z")
-        mock_issue1.issue.comments.return_value = [mock_comment1, mock_comment2]
-
-        # Set up the mock GitHub pull request comments (one ignored, one not ignored)
-        mock_pr_comment1 = MagicMock()
-        mock_pr_comment1.submitted_at = datetime.fromisoformat("2023-01-02T12:00:00Z")
-        mock_pr_comment2 = MagicMock()
-        mock_pr_comment2.submitted_at = datetime.fromisoformat(
-            "2023-01-04T00:00:00Z"
-        )  # first response
-        mock_pull_request = MagicMock()
-        mock_pull_request.reviews.return_value = [mock_pr_comment1, mock_pr_comment2]
-
-        ready_for_review_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
-
-        # Call the function
-        result = measure_time_to_first_response(
-            mock_issue1, None, mock_pull_request, ready_for_review_at
-        )
-        expected_result = timedelta(days=1)
-
-        # Check the results
-        self.assertEqual(result, expected_result)
-
-    def test_measure_time_to_first_response_ignore_users(self):
-        """Test that measure_time_to_first_response ignores comments from ignored users."""
-        # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 4
-        mock_issue1.issue.user.login = "issue_owner"
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
-
-        # Set up the mock GitHub issue comments (one ignored, one not ignored)
-        mock_comment1 = MagicMock()
-        mock_comment1.user.login = "ignored_user"
-        mock_comment1.created_at = datetime.fromisoformat("2023-01-02T00:00:00Z")
-        mock_comment2 = MagicMock()
-        mock_comment2.user.login = "not_ignored_user"
-        mock_comment2.created_at = datetime.fromisoformat("2023-01-05T00:00:00Z")
-        mock_issue1.issue.comments.return_value = [mock_comment1, mock_comment2]
-
-        # Set up the mock GitHub pull request comments (one ignored, one not ignored)
-        mock_pr_comment1 = MagicMock()
-        mock_pr_comment1.user.login = "ignored_user"
-        mock_pr_comment1.submitted_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
-        mock_pr_comment2 = MagicMock()
-        mock_pr_comment2.user.login = "not_ignored_user"
-        mock_pr_comment2.submitted_at = datetime.fromisoformat(
-            "2023-01-04T00:00:00Z"
-        )  # first response
-        mock_pull_request = MagicMock()
-        mock_pull_request.reviews.return_value = [mock_pr_comment1, mock_pr_comment2]
-
-        # Call the function
-        result = measure_time_to_first_response(
-            mock_issue1, None, mock_pull_request, None, ["ignored_user"]
-        )
-        expected_result = timedelta(days=3)
 
-        # Check the results
-        self.assertEqual(result, expected_result)
+@dataclass(slots=True, frozen=True)
+class FakeUser:
+    """The parts of a github3 user that the ignore checks read."""
 
-    def test_measure_time_to_first_response_ignore_pending_review(self):
-        """Test that measure_time_to_first_response ignores pending reviews"""
+    login: str = "responder"
+    type: str = "User"
 
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 2
-        mock_issue1.issue.user.login = "issue_owner"
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
 
-        # Set up the mock GitHub pull request comments (one ignored, one not ignored)
-        # Pending Review
-        mock_pr_comment1 = MagicMock()
-        mock_pr_comment1.submitted_at = None
-        # Submitted Comment
-        mock_pr_comment2 = MagicMock()
-        mock_pr_comment2.submitted_at = datetime.fromisoformat("2023-01-04T00:00:00Z")
+ISSUE_OWNER = FakeUser(login="issue_owner")
 
-        mock_pull_request = MagicMock()
-        mock_pull_request.reviews.return_value = [mock_pr_comment1, mock_pr_comment2]
 
-        ready_for_review_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
+@dataclass(slots=True, frozen=True)
+class FakeComment:
+    """An issue comment."""
 
-        # Call the function
-        result = measure_time_to_first_response(
-            mock_issue1, None, mock_pull_request, ready_for_review_at
-        )
-        expected_result = timedelta(days=1)
-
-        # Check the results
-        self.assertEqual(result, expected_result)
-
-    def test_measure_time_to_first_response_only_ignored_users(self):
-        """Test that measure_time_to_first_response returns empty for an issue with only ignored users."""
-        # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 4
-        mock_issue1.issue.user.login = "issue_owner"
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
-
-        # Set up the mock GitHub issue comments (all ignored)
-        mock_comment1 = MagicMock()
-        mock_comment1.user.login = "ignored_user"
-        mock_comment1.created_at = datetime.fromisoformat("2023-01-02T00:00:00Z")
-        mock_comment2 = MagicMock()
-        mock_comment2.user.login = "ignored_user2"
-        mock_comment2.created_at = datetime.fromisoformat("2023-01-05T00:00:00Z")
-        mock_issue1.issue.comments.return_value = [mock_comment1, mock_comment2]
-
-        # Set up the mock GitHub pull request comments (all ignored)
-        mock_pr_comment1 = MagicMock()
-        mock_pr_comment1.user.login = "ignored_user"
-        mock_pr_comment1.submitted_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
-        mock_pr_comment2 = MagicMock()
-        mock_pr_comment2.user.login = "ignored_user2"
-        mock_pr_comment2.submitted_at = datetime.fromisoformat("2023-01-04T12:00:00Z")
-        mock_pull_request = MagicMock()
-        mock_pull_request.reviews.return_value = [mock_pr_comment1, mock_pr_comment2]
-
-        # Call the function
-        result = measure_time_to_first_response(
-            mock_issue1,
+    created_at: datetime
+    user: FakeUser = FakeUser()
+
+
+@dataclass(slots=True, frozen=True)
+class FakeReview:
+    """A pull request review; submitted_at is None while the review is pending."""
+
+    submitted_at: Union[datetime, None]
+    user: FakeUser = FakeUser()
+
+
+@dataclass(slots=True, frozen=True)
+class FakeIssue:
+    """The github3 issue behind a search result."""
+
+    user: FakeUser = ISSUE_OWNER
+    comment_list: tuple = ()
+
+    @property
+    def comments_count(self):
+        """The number of comments, as reported on the issue itself."""
+        return len(self.comment_list)
+
+    def comments(self, **_kwargs):
+        """Return the issue comments, ignoring the paging arguments."""
+        return self.comment_list
+
+
+@dataclass(slots=True, frozen=True)
+class FakeIssueWrap:
+    """An issue search result wrapping a github3 issue."""
+
+    issue: FakeIssue
+    created_at: str = "2023-01-01T00:00:00Z"
+
+
+@dataclass(slots=True, frozen=True)
+class FakePR:
+    """A github3 pull request."""
+
+    review_list: tuple = ()
+
+    def reviews(self, **_kwargs):
+        """Return the pull request reviews, ignoring the paging arguments."""
+        return self.review_list
+
+
+IGNORED_USER = FakeUser(login="ignored_user")
+IGNORED_USER2 = FakeUser(login="ignored_user2")
+OTHER_USER = FakeUser(login="other_user")
+BOT = FakeUser(login="some_bot", type="Bot")
+
+ISSUES_WITH_FIRST_RESPONSE = (
+    IssueWithMetrics(
+        "Issue 1", "https://github.com/user/repo/issues/1", "alice", ONE_DAY
+    ),
+    IssueWithMetrics(
+        "Issue 2", "https://github.com/user/repo/issues/2", "bob", TWO_DAYS
+    ),
+    IssueWithMetrics("Issue 3", "https://github.com/user/repo/issues/3", "carol", None),
+)
+ISSUES_WITHOUT_FIRST_RESPONSE = (
+    IssueWithMetrics("Issue 1", "https://github.com/user/repo/issues/1", "alice", None),
+    IssueWithMetrics("Issue 2", "https://github.com/user/repo/issues/2", "bob", None),
+)
+
+
+class TestMeasureTimeToFirstResponse(unittest.TestCase):
+    """Test the measure_time_to_first_response function."""
+
+    # (name, issue comments, pull request reviews or None for a plain issue,
+    #  ready_for_review_at, ignore_users, expected time to first response)
+    CASES: tuple = (
+        (
+            "first issue comment",
+            (FakeComment(JAN_02), FakeComment(JAN_02_NOON)),
+            None,
+            None,
+            None,
+            ONE_DAY,
+        ),
+        ("no comments", (), None, None, None, None),
+        (
+            "pull request reviews",
+            (),
+            (FakeReview(JAN_02), FakeReview(JAN_02_NOON)),
+            None,
+            None,
+            ONE_DAY,
+        ),
+        (
+            "issue comment faster",
+            (FakeComment(JAN_02),),
+            (FakeReview(JAN_03),),
+            None,
+            None,
+            ONE_DAY,
+        ),
+        (
+            "pull request review faster",
+            (FakeComment(JAN_03),),
+            (FakeReview(JAN_02),),
             None,
-            mock_pull_request,
+            None,
+            ONE_DAY,
+        ),
+        (
+            "ignore responses before ready for review",
+            (FakeComment(JAN_02), FakeComment(JAN_05)),
+            (FakeReview(JAN_02_NOON), FakeReview(JAN_04)),
+            JAN_03,
+            None,
+            ONE_DAY,
+        ),
+        (
+            "ignore users",
+            (FakeComment(JAN_02, IGNORED_USER), FakeComment(JAN_05, OTHER_USER)),
+            (FakeReview(JAN_03, IGNORED_USER), FakeReview(JAN_04, OTHER_USER)),
+            None,
+            ["ignored_user"],
+            THREE_DAYS,
+        ),
+        (
+            "ignore pending review",
+            (),
+            (FakeReview(None), FakeReview(JAN_04)),
+            JAN_03,
+            None,
+            ONE_DAY,
+        ),
+        (
+            "only ignored users",
+            (FakeComment(JAN_02, IGNORED_USER), FakeComment(JAN_05, IGNORED_USER2)),
+            (
+                FakeReview(JAN_03, IGNORED_USER),
+                FakeReview(JAN_04_NOON, IGNORED_USER2),
+            ),
             None,
             ["ignored_user", "ignored_user2"],
+            None,
+        ),
+        (
+            "ignore issue owner",
+            (FakeComment(JAN_02, ISSUE_OWNER), FakeComment(JAN_05, OTHER_USER)),
+            (FakeReview(JAN_03, ISSUE_OWNER), FakeReview(JAN_04, OTHER_USER)),
+            None,
+            None,
+            THREE_DAYS,
+        ),
+        (
+            "ignore bot",
+            (FakeComment(JAN_02, BOT),),
+            (FakeReview(JAN_03, BOT), FakeReview(JAN_04)),
+            None,
+            None,
+            THREE_DAYS,
+        ),
+    )
+
+    def test_measure_time_to_first_response(self):
+        """Test that measure_time_to_first_response returns the expected time for each case."""
+        for (
+            name,
+            comments,
+            reviews,
+            ready_for_review_at,
+            ignore_users,
+            expected,
+        ) in self.CASES:
+            with self.subTest(case=name):
+                issue = FakeIssueWrap(FakeIssue(comment_list=comments))
+                pull_request = None if reviews is None else FakePR(reviews)
+
+                result = measure_time_to_first_response(
+                    issue, None, pull_request, ready_for_review_at, ignore_users
+                )
+
+                self.assertEqual(result, expected)
+
+    def test_measure_time_to_first_response_skips_comments_without_any(self):
+        """Test that comments are not requested for an issue with no comments."""
+        comments = Mock(return_value=())
+        inner_issue = Mock(
+            spec_set=["comments", "comments_count", "user"],
+            comments=comments,
+            comments_count=0,
         )
-        expected_result = None
-
-        # Check the results
-        self.assertEqual(result, expected_result)
-
-    def test_measure_time_to_first_response_ignore_issue_owners_comment(self):
-        """Test that measure_time_to_first_response ignore issue owner's comment."""
-        # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 4
-        mock_issue1.issue.user.login = "issue_owner"
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
-
-        # Set up the mock GitHub issue comments
-        mock_comment1 = MagicMock()
-        mock_comment1.user.login = "issue_owner"
-        mock_comment1.created_at = datetime.fromisoformat("2023-01-02T00:00:00Z")
-        mock_comment2 = MagicMock()
-        mock_comment2.user.login = "other_user"
-        mock_comment2.created_at = datetime.fromisoformat("2023-01-05T00:00:00Z")
-        mock_issue1.issue.comments.return_value = [mock_comment1, mock_comment2]
-
-        # Set up the mock GitHub pull request comments
-        mock_pr_comment1 = MagicMock()
-        mock_pr_comment1.user.login = "issue_owner"
-        mock_pr_comment1.submitted_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
-        mock_pr_comment2 = MagicMock()
-        mock_pr_comment2.user.login = "other_user"
-        mock_pr_comment2.submitted_at = datetime.fromisoformat("2023-01-04T00:00:00Z")
-        mock_pull_request = MagicMock()
-        mock_pull_request.reviews.return_value = [mock_pr_comment1, mock_pr_comment2]
-
-        # Call the function
-        result = measure_time_to_first_response(
-            mock_issue1, None, mock_pull_request, None
+
+        result = measure_time_to_first_response(FakeIssueWrap(inner_issue), None)
+
+        self.assertIsNone(result)
+        comments.assert_not_called()
+
+    def test_measure_time_to_first_response_prefetched(self):
+        """Test that comments and reviews fetched by the caller are not requested again."""
+        comments = Mock(return_value=())
+        inner_issue = Mock(
+            spec_set=["comments", "comments_count", "user"],
+            comments=comments,
+            comments_count=1,
+            user=ISSUE_OWNER,
         )
-        expected_result = timedelta(days=3)
-
-        # Check the results
-        self.assertEqual(result, expected_result)
-
-    def test_measure_time_to_first_response_ignore_bot(self):
-        """Test that measure_time_to_first_response ignore bot's comment."""
-        # Set up the mock GitHub issues
-        mock_issue1 = MagicMock()
-        mock_issue1.comments = 2
-        mock_issue1.created_at = "2023-01-01T00:00:00Z"
-
-        # Set up the mock GitHub issue comments
-        mock_comment1 = MagicMock()
-        mock_comment1.user.type = "Bot"
-        mock_comment1.created_at = datetime.fromisoformat("2023-01-02T00:00:00Z")
-        mock_issue1.issue.comments.return_value = [mock_comment1]
-
-        # Set up the mock GitHub pull request comments
-        mock_pr_comment1 = MagicMock()
-        mock_pr_comment1.user.type = "Bot"
-        mock_pr_comment1.submitted_at = datetime.fromisoformat("2023-01-03T00:00:00Z")
-        mock_pr_comment2 = MagicMock()
-        mock_pr_comment2.user.type = "User"
-        mock_pr_comment2.submitted_at = datetime.fromisoformat(
-            "2023-01-04T00:00:00Z"
-        )  # first response
-        mock_pull_request = MagicMock()
-        mock_pull_request.reviews.return_value = [mock_pr_comment1, mock_pr_comment2]
-
-        # Call the function
+        reviews = Mock(return_value=())
+        pull_request = Mock(spec_set=["reviews"], reviews=reviews)
+
         result = measure_time_to_first_response(
-            mock_issue1, None, mock_pull_request, None
+            FakeIssueWrap(inner_issue),
+            None,
+            pull_request,
+            comments=(FakeComment(JAN_03),),
+            reviews=(FakeReview(JAN_02),),
         )
-        expected_result = timedelta(days=3)
 
-        # Check the results
-        self.assertEqual(result, expected_result)
+        self.assertEqual(result, ONE_DAY)
+        comments.assert_not_called()
+        reviews.assert_not_called()
 
 
 class TestGetStatsTimeToFirstResponse(unittest.TestCase):
     """Test the get_stats_time_to_first_response function."""
 
-    def test_get_stats_time_to_first_response(self):
-        """Test that get_stats_time_to_first_response calculates the correct average.
-
-        This test creates a list of mock GitHub issues with time to first response
-        attributes, calls get_stats_time_to_first_response with the list, and
-        checks that the function returns the correct average time to first response.
-
-        """
-        # Create mock data
-        issues_with_metrics = [
-            IssueWithMetrics(
-                "Issue 1",
-                "https://github.com/user/repo/issues/1",
-                "alice",
-                timedelta(days=1),
-            ),
-            IssueWithMetrics(
-                "Issue 2",
-                "https://github.com/user/repo/issues/2",
-                "bob",
-                timedelta(days=2),
-            ),
-            IssueWithMetrics(
-                "Issue 3", "https://github.com/user/repo/issues/3", "carol", None
-            ),
-        ]
-
-        # Call the function and check the result
-        result = get_stats_time_to_first_response(issues_with_metrics)["avg"]
-        expected_result = timedelta(days=1.5)
-        self.assertEqual(result, expected_result)
-
-    def test_get_stats_time_to_first_response_with_all_none(self):
-        """Test that get_stats_time_to_first_response with all None data."""
+    # (name, issues with metrics, expected average time to first response)
+    CASES: tuple = (
+        ("mixed", ISSUES_WITH_FIRST_RESPONSE, timedelta(days=1, hours=12)),
+        ("all none", ISSUES_WITHOUT_FIRST_RESPONSE, None),
+    )
 
-        # Create mock data with all None
-        issues_with_metrics = [
-            IssueWithMetrics(
-                "Issue 1", "https://github.com/user/repo/issues/1", "alice", None
-            ),
-            IssueWithMetrics(
-                "Issue 2", "https://github.com/user/repo/issues/2", "bob", None
-            ),
-        ]
-
-        # Call the function and check the result
-        result = get_stats_time_to_first_response(issues_with_metrics)
-        expected_result = None
-        self.assertEqual(result, expected_result)
+    def test_get_stats_time_to_first_response(self):
+        """Test get_stats_time_to_first_response against each case in CASES."""
+        for name, issues, expected in self.CASES:
+            with self.subTest(case=name):
+                result = get_stats_time_to_first_response(issues)
+                self.assertEqual(None if result is None else result["avg"], expected)
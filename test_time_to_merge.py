@@ -10,44 +10,44 @@ Classes:
 """
 
 import unittest
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 from time_to_merge import measure_time_to_merge
 
+CREATED_AT = datetime(2021, 1, 1, tzinfo=timezone.utc)
+MERGED_AT = datetime(2021, 1, 3, tzinfo=timezone.utc)
+TWO_DAYS = timedelta(days=2)
+
 
 class TestMeasureTimeToMerge(unittest.TestCase):
     """Test suite for the measure_time_to_merge function."""
 
     def test_measure_time_to_merge_ready_for_review(self):
         """Test that the function correctly measures the time to merge a pull request that was formerly a draft."""
-        # Create a mock pull request object
-        pull_request = MagicMock()
-        pull_request.merged_at = datetime.fromisoformat("2021-01-03T00:00:00Z")
-        ready_for_review_at = datetime.fromisoformat("2021-01-01T00:00:00Z")
+        # Create a stand-in pull request object
+        pull_request = SimpleNamespace(merged_at=MERGED_AT)
+        ready_for_review_at = CREATED_AT
 
         # Call the function and check the result
         result = measure_time_to_merge(pull_request, ready_for_review_at)
-        expected_result = timedelta(days=2)
+        expected_result = TWO_DAYS
         self.assertEqual(result, expected_result)
 
     def test_measure_time_to_merge_created_at(self):
         """Test that the function correctly measures the time to merge a pull request that was never a draft."""
-        # Create a mock pull request object
-        pull_request = MagicMock()
-        pull_request.merged_at = datetime.fromisoformat("2021-01-03T00:00:00Z")
-        pull_request.created_at = datetime.fromisoformat("2021-01-01T00:00:00Z")
+        # Create a stand-in pull request object
+        pull_request = SimpleNamespace(merged_at=MERGED_AT, created_at=CREATED_AT)
 
         # Call the function and check the result
         result = measure_time_to_merge(pull_request, None)
-        expected_result = timedelta(days=2)
+        expected_result = TWO_DAYS
         self.assertEqual(result, expected_result)
 
     def test_measure_time_to_merge_returns_none(self):
         """Test that the function returns None if the pull request is not merged."""
-        # Create a mock issue object
-        pull_request = MagicMock()
-        pull_request.merged_at = None
+        # Create a stand-in pull request object
+        pull_request = SimpleNamespace(merged_at=None)
 
         # Call the function and check that it returns None
         self.assertEqual(None, measure_time_to_merge(pull_request, None))
@@ -10,11 +10,14 @@ Classes:
 """
 
 import unittest
-from datetime import datetime
-from unittest.mock import MagicMock
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 from time_to_ready_for_review import get_time_to_ready_for_review
 
+READY_FOR_REVIEW_AT = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
 
 class TestGetTimeToReadyForReview(unittest.TestCase):
     """Test suite for the get_time_to_ready_for_review function."""
@@ -22,23 +25,22 @@ class TestGetTimeToReadyForReview(unittest.TestCase):
     # def draft pr function
     def test_time_to_ready_for_review_draft(self):
         """Test that the function returns None when the pull request is a draft"""
-        pull_request = MagicMock()
-        pull_request.draft = True
-        issue = MagicMock()
+        events = Mock(return_value=())
+        issue = SimpleNamespace(issue=SimpleNamespace(events=events))
+        pull_request = SimpleNamespace(draft=True)
 
         result = get_time_to_ready_for_review(issue, pull_request)
         expected_result = None
         self.assertEqual(result, expected_result)
+        events.assert_not_called()
 
     def test_get_time_to_ready_for_review_event(self):
         """Test that the function correctly gets the time a pull request was marked as ready for review"""
-        pull_request = MagicMock()
-        pull_request.draft = False
-        event = MagicMock()
-        event.event = "ready_for_review"
-        event.created_at = datetime.fromisoformat("2021-01-01T00:00:00Z")
-        issue = MagicMock()
-        issue.issue.events.return_value = [event]
+        event = SimpleNamespace(
+            event="ready_for_review", created_at=READY_FOR_REVIEW_AT
+        )
+        issue = SimpleNamespace(issue=SimpleNamespace(events=lambda **_: (event,)))
+        pull_request = SimpleNamespace(draft=False)
 
         result = get_time_to_ready_for_review(issue, pull_request)
         expected_result = event.created_at
@@ -46,14 +48,23 @@ class TestGetTimeToReadyForReview(unittest.TestCase):
 
     def test_get_time_to_ready_for_review_no_event(self):
         """Test that the function returns None when the pull request is not a draft and no ready_for_review event is found"""
-        pull_request = MagicMock()
-        pull_request.draft = False
-        event = MagicMock()
-        event.event = "foobar"
-        event.created_at = "2021-01-01T00:00:00Z"
-        issue = MagicMock()
-        issue.events.return_value = [event]
+        event = SimpleNamespace(event="foobar", created_at=READY_FOR_REVIEW_AT)
+        issue = SimpleNamespace(issue=SimpleNamespace(events=lambda **_: (event,)))
+        pull_request = SimpleNamespace(draft=False)
 
         result = get_time_to_ready_for_review(issue, pull_request)
         expected_result = None
         self.assertEqual(result, expected_result)
+
+    def test_get_time_to_ready_for_review_prefetched_events(self):
+        """Test that the function uses events the caller already fetched"""
+        event = SimpleNamespace(
+            event="ready_for_review", created_at=READY_FOR_REVIEW_AT
+        )
+        events = Mock(return_value=())
+        issue = SimpleNamespace(issue=SimpleNamespace(events=events))
+        pull_request = SimpleNamespace(draft=False)
+
+        result = get_time_to_ready_for_review(issue, pull_request, (event,))
+        self.assertEqual(result, READY_FOR_REVIEW_AT)
+        events.assert_not_called()
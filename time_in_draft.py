@@ -2,41 +2,73 @@
 This module contains a function that measures the time a pull request has been in draft state.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Union
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Iterable, List, Union
 
-import github3
-import numpy
-import pytz
 from classes import IssueWithMetrics
+from stats import get_duration_stats
+
+if TYPE_CHECKING:
+    import github3
 
 
 def measure_time_in_draft(
     issue: github3.issues.Issue,
+    pull_request: Union[github3.pulls.PullRequest, None] = None,
+    now: Union[datetime, None] = None,
+    events: Union[Iterable[github3.issues.event.IssueEvent], None] = None,
 ) -> Union[timedelta, None]:
     """If a pull request has had time in the draft state, return the cumulative amount of time it was in draft.
 
     args:
         issue (github3.issues.Issue): A GitHub issue which has been pre-qualified as a pull request.
+        pull_request (Union[github3.pulls.PullRequest, None]): The pull request, used to tell
+            whether a pull request without draft events is still the draft it was opened as.
+        now (Union[datetime, None]): The time an ongoing draft is measured up to.
+            Defaults to the current time.
+        events (Union[Iterable[github3.issues.event.IssueEvent], None]): The pull request's
+            events if the caller has already fetched them. Fetched from the issue otherwise.
 
     returns:
         Union[timedelta, None]: Total time the pull request has spent in draft state.
     """
-    events = issue.events()
-    draft_start = None
+    if events is None:
+        events = issue.issue.events()
+    # A pull request opened as a draft has no converted_to_draft event, so its
+    # first draft interval starts when it was created
+    draft_start = issue.issue.created_at
+    seen_draft_event = False
     total_draft_time = timedelta(0)
 
-    for event in events:
-        if event.event == "converted_to_draft":
-            draft_start = event.created_at
-        elif event.event == "ready_for_review" and draft_start:
-            # Calculate draft time for this interval
-            total_draft_time += event.created_at - draft_start
-            draft_start = None
+    try:
+        for event in events:
+            if event.event == "converted_to_draft":
+                draft_start = event.created_at
+                seen_draft_event = True
+            elif event.event == "ready_for_review":
+                if draft_start:
+                    # Calculate draft time for this interval
+                    total_draft_time += event.created_at - draft_start
+                draft_start = None
+                seen_draft_event = True
+    except TypeError as e:
+        print(
+            f"An error occurred processing review events. Perhaps issue contains a ghost user. {e}"
+        )
+        return None
+
+    # Without any draft events, the pull request is only in draft if it was
+    # opened as one and has not been marked ready for review yet
+    if not seen_draft_event and not (pull_request and pull_request.draft):
+        draft_start = None
 
     # If the PR is currently in draft state, calculate the time in draft up to now
     if draft_start and issue.issue.state == "open":
-        total_draft_time += datetime.now(pytz.utc) - draft_start
+        if now is None:
+            now = datetime.now(timezone.utc)
+        total_draft_time += now - draft_start
 
     return total_draft_time if total_draft_time > timedelta(0) else None
 
@@ -47,35 +79,14 @@ def get_stats_time_in_draft(
     """
     Calculate stats describing the time in draft for a list of issues.
     """
-    # Filter out issues with no time in draft
-    issues_with_time_to_draft = [
-        issue for issue in issues_with_metrics if issue.time_in_draft is not None
-    ]
-
-    # Calculate the total time in draft for all issues
-    draft_times = []
-    if issues_with_time_to_draft:
-        for issue in issues_with_time_to_draft:
-            if issue.time_in_draft:
-                draft_times.append(issue.time_in_draft.total_seconds())
-
-    # Calculate stats describing time in draft
-    num_issues_with_time_in_draft = len(issues_with_time_to_draft)
-    if num_issues_with_time_in_draft > 0:
-        average_time_in_draft = numpy.round(numpy.average(draft_times))
-        med_time_in_draft = numpy.round(numpy.median(draft_times))
-        ninety_percentile_time_in_draft = numpy.round(
-            numpy.percentile(draft_times, 90, axis=0)
-        )
-    else:
+    stats = get_duration_stats(
+        time_in_draft.total_seconds()
+        for issue in issues_with_metrics
+        if (time_in_draft := issue.time_in_draft)
+    )
+    if stats is None:
         return None
 
-    stats = {
-        "avg": timedelta(seconds=average_time_in_draft),
-        "med": timedelta(seconds=med_time_in_draft),
-        "90p": timedelta(seconds=ninety_percentile_time_in_draft),
-    }
-
     # Print the average time in draft converting seconds to a readable time format
-    print(f"Average time in draft: {timedelta(seconds=average_time_in_draft)}")
+    print(f"Average time in draft: {stats['avg']}")
     return stats
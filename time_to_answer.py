@@ -15,11 +15,12 @@ Functions:
 
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import List, Union
 
-import numpy
 from classes import IssueWithMetrics
+from datetime_helpers import parse_datetime
+from stats import get_duration_stats
 
 
 def get_stats_time_to_answer(
@@ -28,37 +29,16 @@ def get_stats_time_to_answer(
     """
     Calculate stats describing the time to answer for a list of issues.
     """
-    # Filter out issues with no time to answer
-    issues_with_time_to_answer = [
-        issue for issue in issues_with_metrics if issue.time_to_answer is not None
-    ]
-
-    # Calculate the total time to answer for all issues
-    answer_times = []
-    if issues_with_time_to_answer:
-        for issue in issues_with_time_to_answer:
-            if issue.time_to_answer:
-                answer_times.append(issue.time_to_answer.total_seconds())
-
-    # Calculate stats describing time to answer
-    num_issues_with_time_to_answer = len(issues_with_time_to_answer)
-    if num_issues_with_time_to_answer > 0:
-        average_time_to_answer = numpy.round(numpy.average(answer_times))
-        med_time_to_answer = numpy.round(numpy.median(answer_times))
-        ninety_percentile_time_to_answer = numpy.round(
-            numpy.percentile(answer_times, 90, axis=0)
-        )
-    else:
+    stats = get_duration_stats(
+        time_to_answer.total_seconds()
+        for issue in issues_with_metrics
+        if (time_to_answer := issue.time_to_answer)
+    )
+    if stats is None:
         return None
 
-    stats = {
-        "avg": timedelta(seconds=average_time_to_answer),
-        "med": timedelta(seconds=med_time_to_answer),
-        "90p": timedelta(seconds=ninety_percentile_time_to_answer),
-    }
-
     # Print the average time to answer converting seconds to a readable time format
-    print(f"Average time to answer: {timedelta(seconds=average_time_to_answer)}")
+    print(f"Average time to answer: {stats['avg']}")
     return stats
 
 
@@ -79,7 +59,7 @@ def measure_time_to_answer(discussion: dict) -> Union[timedelta, None]:
         return None
 
     # Get the time to answer
-    answer_time = datetime.fromisoformat(discussion["answerChosenAt"])
-    created_time = datetime.fromisoformat(discussion["createdAt"])
+    answer_time = parse_datetime(discussion["answerChosenAt"])
+    created_time = parse_datetime(discussion["createdAt"])
 
     return answer_time - created_time
@@ -16,12 +16,17 @@ Functions:
 
 """
 
-from datetime import datetime, timedelta
-from typing import List, Union
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, List, Union
 
-import github3
-import numpy
 from classes import IssueWithMetrics
+from datetime_helpers import parse_datetime, to_datetime
+from stats import get_duration_stats
+
+if TYPE_CHECKING:
+    import github3
 
 
 def measure_time_to_close(
@@ -37,21 +42,18 @@ def measure_time_to_close(
         Union[datetime.timedelta, None]: The time it takes to close the issue.
 
     """
-    closed_at, created_at = None, None
     if issue:
         if issue.state != "closed":
             return None
-        closed_at = datetime.fromisoformat(issue.closed_at)
-        created_at = datetime.fromisoformat(issue.created_at)
+        return to_datetime(issue.closed_at) - to_datetime(issue.created_at)
 
     if discussion:
         if discussion["closedAt"] is None:
             return None
-        closed_at = datetime.fromisoformat(discussion["closedAt"])
-        created_at = datetime.fromisoformat(discussion["createdAt"])
+        return parse_datetime(discussion["closedAt"]) - parse_datetime(
+            discussion["createdAt"]
+        )
 
-    if closed_at and created_at:
-        return closed_at - created_at
     return None
 
 
@@ -68,37 +70,14 @@ def get_stats_time_to_close(
         Union[Dict{string: float}, None]: Stats describing the time to close for the issues.
 
     """
-    # Filter out issues with no time to close
-    issues_with_time_to_close = [
-        issue for issue in issues_with_metrics if issue.time_to_close is not None
-    ]
-
-    # Calculate the total time to close for all issues
-    close_times = []
-    total_time_to_close = None
-    if issues_with_time_to_close:
-        total_time_to_close = 0
-        for issue in issues_with_time_to_close:
-            if issue.time_to_close:
-                close_times.append(issue.time_to_close.total_seconds())
-
-    # Calculate stats describing time to close
-    num_issues_with_time_to_close = len(issues_with_time_to_close)
-    if num_issues_with_time_to_close > 0 and total_time_to_close is not None:
-        average_time_to_close = numpy.round(numpy.average(close_times))
-        med_time_to_close = numpy.round(numpy.median(close_times))
-        ninety_percentile_time_to_close = numpy.round(
-            numpy.percentile(close_times, 90, axis=0)
-        )
-    else:
+    stats = get_duration_stats(
+        time_to_close.total_seconds()
+        for issue in issues_with_metrics
+        if (time_to_close := issue.time_to_close)
+    )
+    if stats is None:
         return None
 
-    stats = {
-        "avg": timedelta(seconds=average_time_to_close),
-        "med": timedelta(seconds=med_time_to_close),
-        "90p": timedelta(seconds=ninety_percentile_time_to_close),
-    }
-
     # Print the average time to close converting seconds to a readable time format
-    print(f"Time to close: {timedelta(seconds=average_time_to_close)}")
+    print(f"Time to close: {stats['avg']}")
     return stats
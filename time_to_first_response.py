@@ -18,12 +18,18 @@ Functions:
 
 """
 
+from __future__ import annotations
+
 from datetime import datetime, timedelta
-from typing import List, Union
+from itertools import islice
+from typing import TYPE_CHECKING, Collection, Iterable, List, Union
 
-import github3
-import numpy
 from classes import IssueWithMetrics
+from datetime_helpers import parse_datetime
+from stats import get_duration_stats
+
+if TYPE_CHECKING:
+    import github3
 
 
 def measure_time_to_first_response(
@@ -31,7 +37,9 @@ def measure_time_to_first_response(
     discussion: Union[dict, None],
     pull_request: Union[github3.pulls.PullRequest, None] = None,
     ready_for_review_at: Union[datetime, None] = None,
-    ignore_users: Union[List[str], None] = None,
+    ignore_users: Union[Collection[str], None] = None,
+    comments: Union[Iterable[github3.issues.comment.IssueComment], None] = None,
+    reviews: Union[Iterable[github3.pulls.PullReview], None] = None,
 ) -> Union[timedelta, None]:
     """Measure the time to first response for a single issue, pull request, or a discussion.
 
@@ -39,7 +47,11 @@ def measure_time_to_first_response(
         issue (Union[github3.issues.Issue, None]): A GitHub issue.
         discussion (Union[dict, None]): A GitHub discussion.
         pull_request (Union[github3.pulls.PullRequest, None]): A GitHub pull request.
-        ignore_users (List[str]): A list of GitHub usernames to ignore.
+        ignore_users (Collection[str]): GitHub usernames to ignore.
+        comments (Union[Iterable[github3.issues.comment.IssueComment], None]): The issue's
+            comments, oldest first, if the caller has already fetched them.
+        reviews (Union[Iterable[github3.pulls.PullReview], None]): The pull request's
+            reviews if the caller has already fetched them.
 
     Returns:
         Union[timedelta, None]: The time to first response for the issue/discussion.
@@ -49,68 +61,79 @@ def measure_time_to_first_response(
     first_comment_time = None
     earliest_response = None
     issue_time = None
-    if ignore_users is None:
-        ignore_users = []
+    ignore_users = frozenset(ignore_users or ())
 
     # Get the first comment time
     if issue:
-        comments = issue.issue.comments(
-            number=20, sort="created", direction="asc"
-        )  # type: ignore
-        for comment in comments:
-            if ignore_comment(
-                issue.issue.user,
-                comment.user,
-                ignore_users,
-                comment.created_at,
-                ready_for_review_at,
-            ):
-                continue
-            first_comment_time = comment.created_at
-            break
+        # Skip the request entirely when the issue has no comments
+        if issue.issue.comments_count:
+            if comments is None:
+                comments = issue.issue.comments(
+                    number=20, sort="created", direction="asc"
+                )  # type: ignore
+            first_comment_time = next(
+                (
+                    comment.created_at
+                    for comment in islice(comments, 20)
+                    if not ignore_comment(
+                        issue.issue.user,
+                        comment.user,
+                        ignore_users,
+                        comment.created_at,
+                        ready_for_review_at,
+                    )
+                ),
+                None,
+            )
 
         # Check if the issue is actually a pull request
         # so we may also get the first review comment time
         if pull_request:
-            review_comments = pull_request.reviews(number=50)  # type: ignore
+            if reviews is None:
+                reviews = pull_request.reviews(number=50)  # type: ignore
             try:
-                for review_comment in review_comments:
-                    if ignore_comment(
-                        issue.issue.user,
-                        review_comment.user,
-                        ignore_users,
-                        review_comment.submitted_at,
-                        ready_for_review_at,
-                    ):
-                        continue
-                    first_review_comment_time = review_comment.submitted_at
-                    break
+                first_review_comment_time = next(
+                    (
+                        review_comment.submitted_at
+                        for review_comment in islice(reviews, 50)
+                        if not ignore_comment(
+                            issue.issue.user,
+                            review_comment.user,
+                            ignore_users,
+                            review_comment.submitted_at,
+                            ready_for_review_at,
+                        )
+                    ),
+                    None,
+                )
             except TypeError as e:
                 print(
                     f"An error occurred processing review comments. Perhaps the review contains a ghost user. {e}"
                 )
 
         # Figure out the earliest response timestamp
-        if first_comment_time and first_review_comment_time:
-            earliest_response = min(first_comment_time, first_review_comment_time)
-        elif first_comment_time:
-            earliest_response = first_comment_time
-        elif first_review_comment_time:
-            earliest_response = first_review_comment_time
-        else:
+        earliest_response = min(
+            (
+                response_time
+                for response_time in (first_comment_time, first_review_comment_time)
+                if response_time is not None
+            ),
+            default=None,
+        )
+        if earliest_response is None:
             return None
 
         # Get the created_at time for the issue so we can calculate the time to first response
         if ready_for_review_at:
             issue_time = ready_for_review_at
         else:
-            issue_time = datetime.fromisoformat(issue.created_at)
+            issue_time = parse_datetime(issue.created_at)
 
     if discussion and len(discussion["comments"]["nodes"]) > 0:
-        earliest_response = datetime.fromisoformat(
+        earliest_response = parse_datetime(
             discussion["comments"]["nodes"][0]["createdAt"]
         )
-        issue_time = datetime.fromisoformat(discussion["createdAt"])
+        issue_time = parse_datetime(discussion["createdAt"])
 
     if earliest_response and issue_time:
         time_between_issue_and_first_comment: timedelta | None = (
@@ -124,7 +147,7 @@ def measure_time_to_first_response(
 def ignore_comment(
     issue_user: github3.users.User,
     comment_user: github3.users.User,
-    ignore_users: List[str],
+    ignore_users: Collection[str],
     comment_created_at: datetime,
     ready_for_review_at: Union[datetime, None],
 ) -> bool:
@@ -161,32 +184,14 @@ def get_stats_time_to_first_response(
         Union[Dict{String: datetime.timedelta}, None]: The stats describing time to first response for the issues in seconds.
 
     """
-    response_times = []
-    none_count = 0
-    for issue in issues:
-        if issue.time_to_first_response:
-            response_times.append(issue.time_to_first_response.total_seconds())
-        else:
-            none_count += 1
-
-    if len(issues) - none_count <= 0:
-        return None
-
-    average_seconds_to_first_response = numpy.round(numpy.average(response_times))
-    med_seconds_to_first_response = numpy.round(numpy.median(response_times))
-    ninety_percentile_seconds_to_first_response = numpy.round(
-        numpy.percentile(response_times, 90, axis=0)
+    stats = get_duration_stats(
+        time_to_first_response.total_seconds()
+        for issue in issues
+        if (time_to_first_response := issue.time_to_first_response)
     )
-
-    stats = {
-        "avg": timedelta(seconds=average_seconds_to_first_response),
-        "med": timedelta(seconds=med_seconds_to_first_response),
-        "90p": timedelta(seconds=ninety_percentile_seconds_to_first_response),
-    }
+    if stats is None:
+        return None
 
     # Print the average time to first response converting seconds to a readable time format
-    print(
-        f"Average time to first response: {timedelta(seconds=average_seconds_to_first_response)}"
-    )
-
+    print(f"Average time to first response: {stats['avg']}")
     return stats
@@ -12,10 +12,13 @@ Functions:
 
 """
 
+from __future__ import annotations
+
 from datetime import datetime, timedelta
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-import github3
+if TYPE_CHECKING:
+    import github3
 
 
 def measure_time_to_merge(
@@ -31,14 +34,11 @@ def measure_time_to_merge(
         Union[datetime.timedelta, None]: The time it takes to close the issue.
 
     """
-    merged_at = None
-    if pull_request.merged_at is None:
-        return None
-
     merged_at = pull_request.merged_at
+    if merged_at is None:
+        return None
 
     if ready_for_review_at:
         return merged_at - ready_for_review_at
 
-    created_at = pull_request.created_at
-    return merged_at - created_at
+    return merged_at - pull_request.created_at
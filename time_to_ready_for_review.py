@@ -14,15 +14,19 @@ Functions:
 
 """
 
+from __future__ import annotations
+
 from datetime import datetime
-from typing import Union
+from typing import TYPE_CHECKING, Iterable, Union
 
-import github3
+if TYPE_CHECKING:
+    import github3
 
 
 def get_time_to_ready_for_review(
     issue: github3.issues.Issue,
     pull_request: github3.pulls.PullRequest,
+    events: Union[Iterable[github3.issues.event.IssueEvent], None] = None,
 ) -> Union[datetime, None]:
     """If a pull request was formerly a draft, get the time it was marked as ready
     for review
@@ -30,6 +34,8 @@ def get_time_to_ready_for_review(
     Args:
         issue (github3.issues.Issue): A GitHub issue.
         pull_request (github3.pulls.PullRequest): A GitHub pull request.
+        events (Union[Iterable[github3.issues.event.IssueEvent], None]): The pull request's
+            events if the caller has already fetched them. Fetched from the issue otherwise.
 
     Returns:
         Union[datetime, None]: The time the pull request was marked as ready for review
@@ -37,7 +43,8 @@ def get_time_to_ready_for_review(
     if pull_request.draft:
         return None
 
-    events = issue.issue.events(number=50)
+    if events is None:
+        events = issue.issue.events(number=50)
     try:
         for event in events:
             if event.event == "ready_for_review":